@@ -12,8 +12,36 @@ This script provides easy access to all main functionalities:
 
 import sys
 import argparse
+import logging
+import logging.handlers
 from pathlib import Path
 
+# Dedicated logger so the src modules keep their own logging configuration
+logger = logging.getLogger("benchmark_main")
+
+def setup_logging(verbose=False):
+    """
+    Route progress messages through a buffered stdout handler.
+
+    Messages are held in memory and flushed at step boundaries (or at once
+    for errors), instead of one write per message.
+
+    Args:
+        verbose (bool): Also emit debug messages
+
+    Returns:
+        logging.handlers.MemoryHandler: The buffering handler, for explicit flushes
+    """
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter('%(message)s'))
+    buffer_handler = logging.handlers.MemoryHandler(
+        capacity=64, flushLevel=logging.ERROR, target=stream_handler
+    )
+    logger.addHandler(buffer_handler)
+    logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+    logger.propagate = False
+    return buffer_handler
+
 def main():
     parser = argparse.ArgumentParser(
         description="Unstructured Performance Benchmark Framework",
@@ -50,13 +78,14 @@ Examples:
     src_path = Path(__file__).parent / 'src'
     sys.path.insert(0, str(src_path))
     
-    if args.verbose:
-        print(f"🔍 Running command: {args.command}")
-        print(f"📁 Source path: {src_path}")
+    log_buffer = setup_logging(args.verbose)
+    logger.debug("🔍 Running command: %s", args.command)
+    logger.debug("📁 Source path: %s", src_path)
     
     try:
         if args.command == 'benchmark':
-            print("🚀 Running Unstructured benchmark...")
+            logger.info("🚀 Running Unstructured benchmark...")
+            log_buffer.flush()
             from unstructured_only_benchmark import UnstructuredOnlyBenchmark
             benchmark = UnstructuredOnlyBenchmark()
             results = benchmark.run_benchmarks()
@@ -65,36 +94,39 @@ Examples:
                 benchmark.save_results()
                 benchmark.print_summary()
                 benchmark.generate_report()
-                print("✅ Benchmark completed!")
-                print("📁 Results saved to:")
-                print("   - data/unstructured_benchmark_results.json")
-                print("   - reports/unstructured_benchmark_report.md")
-                print("   - benchmark.log")
+                logger.info("✅ Benchmark completed!")
+                logger.info("📁 Results saved to:")
+                logger.info("   - data/unstructured_benchmark_results.json")
+                logger.info("   - reports/unstructured_benchmark_report.md")
+                logger.info("   - benchmark.log")
             else:
-                print("❌ No documents were processed. Check the benchmarks directory.")
+                logger.warning("❌ No documents were processed. Check the benchmarks directory.")
             
         elif args.command == 'extract':
             if not args.file:
-                print("❌ Please provide a PDF file path with --file or -f")
-                print("Example: python main.py extract --file benchmarks/short_text/sample.pdf")
+                logger.error("❌ Please provide a PDF file path with --file or -f")
+                logger.error("Example: python main.py extract --file benchmarks/short_text/sample.pdf")
                 return
             
-            print(f"🔍 Extracting chunks from: {args.file}")
+            logger.info("🔍 Extracting chunks from: %s", args.file)
+            log_buffer.flush()
             from extract_chunks_unstructured import extract_document_chunks, print_chunk_analysis
             results = extract_document_chunks(args.file, strategy="hi_res")
             print_chunk_analysis(results)
-            print("✅ Chunk extraction completed!")
+            logger.info("✅ Chunk extraction completed!")
             
         elif args.command == 'category':
-            print("📊 Running category-based analysis...")
+            logger.info("📊 Running category-based analysis...")
+            log_buffer.flush()
             from run_category_chunk_comparison import run_category_comparison
             run_category_comparison()
-            print("✅ Category analysis completed!")
+            logger.info("✅ Category analysis completed!")
             
         elif args.command == 'all':
-            print("🎯 Running all analyses...")
+            logger.info("🎯 Running all analyses...")
             
-            print("\n1️⃣ Running Unstructured benchmark...")
+            logger.info("\n1️⃣ Running Unstructured benchmark...")
+            log_buffer.flush()
             from unstructured_only_benchmark import UnstructuredOnlyBenchmark
             benchmark = UnstructuredOnlyBenchmark()
             results = benchmark.run_benchmarks()
@@ -104,21 +136,24 @@ Examples:
                 benchmark.print_summary()
                 benchmark.generate_report()
             
-            print("\n2️⃣ Running category analysis...")
+            logger.info("\n2️⃣ Running category analysis...")
+            log_buffer.flush()
             from run_category_chunk_comparison import run_category_comparison
             run_category_comparison()
             
-            print("\n✅ All analyses completed!")
-            print("\n📄 Reports generated in 'reports/' directory")
-            print("📊 Data files in 'data/' directory")
+            logger.info("\n✅ All analyses completed!")
+            logger.info("\n📄 Reports generated in 'reports/' directory")
+            logger.info("📊 Data files in 'data/' directory")
             
     except ImportError as e:
-        print(f"❌ Import error: {e}")
-        print("💡 Make sure all dependencies are installed: pip install -r requirements_unstructured_only.txt")
+        logger.error("❌ Import error: %s", e)
+        logger.error("💡 Make sure all dependencies are installed: pip install -r requirements_unstructured_only.txt")
         sys.exit(1)
     except Exception as e:
-        print(f"❌ Error running {args.command}: {e}")
+        logger.error("❌ Error running %s: %s", args.command, e)
         sys.exit(1)
+    finally:
+        log_buffer.flush()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
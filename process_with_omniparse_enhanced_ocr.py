@@ -6,64 +6,231 @@ This script combines RapidTable's structure detection with OCR content extractio
 
 import os
 import sys
+import argparse
+import functools
+import importlib.util
+import threading
+from multiprocessing import AuthenticationError
+from multiprocessing.managers import BaseManager
 from pathlib import Path
 import logging
 from PIL import Image
 import numpy as np
 import cv2
 
-# Import OmniParse components
-try:
-    from surya.detection import DetectionPredictor
-    from surya.recognition import RecognitionPredictor
-    from surya.layout import LayoutPredictor
-    SURYA_AVAILABLE = True
-except ImportError:
-    SURYA_AVAILABLE = False
+# Heavy OCR backends (Torch / Paddle / ONNXRuntime) are only imported when a
+# pipeline actually needs them; availability is checked without importing.
+SURYA_AVAILABLE = importlib.util.find_spec("surya") is not None
+if not SURYA_AVAILABLE:
     print("Warning: Surya OCR not available")
 
-try:
-    from texify.inference import batch_inference
-    TEXIFY_AVAILABLE = True
-except ImportError:
-    TEXIFY_AVAILABLE = False
+TEXIFY_AVAILABLE = importlib.util.find_spec("texify") is not None
+if not TEXIFY_AVAILABLE:
     print("Warning: Texify not available")
 
-try:
-    import marker
-    MARKER_AVAILABLE = True
-except ImportError:
-    MARKER_AVAILABLE = False
+MARKER_AVAILABLE = importlib.util.find_spec("marker") is not None
+if not MARKER_AVAILABLE:
     print("Warning: Marker PDF not available")
 
-# Import RapidTable for table recognition
-try:
-    from rapid_table import RapidTable, RapidTableInput, ModelType, EngineType
-    RAPIDTABLE_AVAILABLE = True
-except ImportError:
-    RAPIDTABLE_AVAILABLE = False
+# RapidTable for table recognition
+RAPIDTABLE_AVAILABLE = importlib.util.find_spec("rapid_table") is not None
+if not RAPIDTABLE_AVAILABLE:
     print("Warning: RapidTable not available")
 
-# Import additional OCR tools for content extraction
-try:
+# Additional OCR tools for content extraction
+EASYOCR_AVAILABLE = importlib.util.find_spec("easyocr") is not None
+if not EASYOCR_AVAILABLE:
+    print("Warning: EasyOCR not available")
+
+PADDLEOCR_AVAILABLE = importlib.util.find_spec("paddleocr") is not None
+if not PADDLEOCR_AVAILABLE:
+    print("Warning: PaddleOCR not available")
+
+@functools.lru_cache(maxsize=None)
+def _get_surya():
+    """Import Surya and return (DetectionPredictor, RecognitionPredictor, LayoutPredictor)."""
+    from surya.detection import DetectionPredictor
+    from surya.recognition import RecognitionPredictor
+    from surya.layout import LayoutPredictor
+    return DetectionPredictor, RecognitionPredictor, LayoutPredictor
+
+@functools.lru_cache(maxsize=None)
+def _get_rapidtable():
+    """Import RapidTable and return (RapidTable, RapidTableInput, ModelType, EngineType)."""
+    from rapid_table import RapidTable, RapidTableInput, ModelType, EngineType
+    return RapidTable, RapidTableInput, ModelType, EngineType
+
+@functools.lru_cache(maxsize=None)
+def _get_easyocr():
+    """Import EasyOCR and return the easyocr.Reader class."""
     import easyocr
-    EASYOCR_AVAILABLE = True
+    return easyocr.Reader
+
+@functools.lru_cache(maxsize=None)
+def _get_paddleocr():
+    """Import PaddleOCR and return the PaddleOCR class."""
+    from paddleocr import PaddleOCR
+    return PaddleOCR
+
+# Optional int8 table structure model produced by quantize_table_model()
+RAPIDTABLE_INT8_MODEL = os.environ.get("RAPIDTABLE_INT8_MODEL")
+
+def quantize_table_model(src_model_path, dst_model_path):
+    """
+    Quantize the RapidTable structure model to int8 with ONNXRuntime.
+    
+    This is a one-off offline step; point RAPIDTABLE_INT8_MODEL at the result
+    to use it. Int8 weights halve the model footprint and use VNNI dot
+    products on CPUs that have them.
+    
+    Args:
+        src_model_path (str): Path to the FP32 ONNX structure model
+        dst_model_path (str): Path to write the int8 ONNX model to
+    """
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+    quantize_dynamic(src_model_path, dst_model_path, weight_type=QuantType.QInt8)
+    logger.info(f"Quantized table model written to {dst_model_path}")
+
+@functools.lru_cache(maxsize=1)
+def get_rapid_table():
+    """Create the configured RapidTable engine once per process."""
+    RapidTable, RapidTableInput, ModelType, EngineType = _get_rapidtable()
+    if RAPIDTABLE_INT8_MODEL:
+        cfg = RapidTableInput(
+            model_type=ModelType.PPSTRUCTURE_EN,
+            model_dir_or_path=RAPIDTABLE_INT8_MODEL,
+            engine_type=EngineType.ONNXRUNTIME,
+            use_ocr=True
+        )
+        # The ONNX session is built from the constructor config
+        rapid_table = RapidTable(cfg)
+        logger.info(f"Using int8 table model: {RAPIDTABLE_INT8_MODEL}")
+    else:
+        cfg = RapidTableInput(
+            model_type=ModelType.PPSTRUCTURE_EN,
+            engine_type=EngineType.ONNXRUNTIME,
+            use_ocr=True
+        )
+        rapid_table = RapidTable()
+    rapid_table.cfg = cfg
+    return rapid_table
+
+@functools.lru_cache(maxsize=1)
+def get_ocr_reader():
+    """
+    Create the cell OCR reader once per process.
+    
+    Returns:
+        The first OCR reader that initializes (EasyOCR, then PaddleOCR), or None
+    """
+    if EASYOCR_AVAILABLE:
+        try:
+            reader = _get_easyocr()(['en', 'ch_sim'])
+            logger.info("EasyOCR initialized successfully")
+            return reader
+        except Exception as e:
+            logger.warning(f"Failed to initialize EasyOCR: {str(e)}")
+    
+    if PADDLEOCR_AVAILABLE:
+        try:
+            reader = _get_paddleocr()(use_angle_cls=True, lang='en')
+            logger.info("PaddleOCR initialized successfully")
+            return reader
+        except Exception as e:
+            logger.warning(f"Failed to initialize PaddleOCR: {str(e)}")
+    
+    return None
+
+@functools.lru_cache(maxsize=1)
+def get_surya_models():
+    """Create the Surya (detection, recognition, layout) predictors once per process."""
+    DetectionPredictor, RecognitionPredictor, LayoutPredictor = _get_surya()
+    models = (DetectionPredictor(), RecognitionPredictor(), LayoutPredictor())
+    logger.info("Surya OCR models initialized successfully")
+    return models
+
+# Numba is optional: it only speeds up the per-cell coordinate math
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
 except ImportError:
-    EASYOCR_AVAILABLE = False
-    print("Warning: EasyOCR not available")
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
+# xxhash is optional: it only speeds up hashing of cell crops
 try:
-    from paddleocr import PaddleOCR
-    PADDLEOCR_AVAILABLE = True
+    import xxhash
+    XXHASH_AVAILABLE = True
 except ImportError:
-    PADDLEOCR_AVAILABLE = False
-    print("Warning: PaddleOCR not available")
+    import hashlib
+    XXHASH_AVAILABLE = False
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def extract_text_from_cell_region(image, bbox, ocr_reader=None):
+@njit(cache=True)
+def _clamped_bbox(bbox, width, height):
+    """
+    Compute the axis-aligned bounds of a cell polygon clamped to the image.
+    
+    Args:
+        bbox: int32 array of coordinates [x1, y1, x2, y2, x3, y3, x4, y4]
+        width: Image width in pixels
+        height: Image height in pixels
+    
+    Returns:
+        tuple: (x1, y1, x2, y2) clamped to [0, width] x [0, height]
+    """
+    x1 = bbox[0]
+    x2 = bbox[0]
+    y1 = bbox[1]
+    y2 = bbox[1]
+    for i in range(2, bbox.shape[0] - 1, 2):
+        x = bbox[i]
+        y = bbox[i + 1]
+        if x < x1:
+            x1 = x
+        if x > x2:
+            x2 = x
+        if y < y1:
+            y1 = y
+        if y > y2:
+            y2 = y
+    
+    x1 = max(0, min(x1, width))
+    x2 = max(0, min(x2, width))
+    y1 = max(0, min(y1, height))
+    y2 = max(0, min(y2, height))
+    return x1, y1, x2, y2
+
+# Compile once at import so the first table does not pay the JIT cost
+_clamped_bbox(np.zeros(8, dtype=np.int32), 1, 1)
+
+def _cell_hash(cell_region):
+    """
+    Hash a cell crop for OCR result reuse.
+    
+    The crop is downsampled to 32x32 first so that cells differing only by
+    a sub-pixel offset (e.g. repeated blank cells) map to the same key.
+    
+    Args:
+        cell_region: numpy array of the cell crop
+    
+    Returns:
+        int: 64-bit hash of the downsampled crop
+    """
+    thumb = cv2.resize(cell_region, (32, 32), interpolation=cv2.INTER_AREA)
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh64(thumb.tobytes()).intdigest()
+    return int.from_bytes(hashlib.blake2b(thumb.tobytes(), digest_size=8).digest(), 'little')
+
+def extract_text_from_cell_region(image, bbox, ocr_reader=None, text_cache=None):
     """
     Extract text from a specific cell region using OCR.
     
@@ -71,61 +238,56 @@ def extract_text_from_cell_region(image, bbox, ocr_reader=None):
         image: PIL Image or numpy array
         bbox: Bounding box coordinates [x1, y1, x2, y2, x3, y3, x4, y4]
         ocr_reader: OCR reader object (EasyOCR or PaddleOCR)
+        text_cache: Optional dict mapping cell hashes to extracted text, shared
+            across the cells of an image so identical crops are OCR'd once
     
     Returns:
         str: Extracted text from the cell
     """
-    try:
-        # Convert PIL image to numpy array if needed
-        if hasattr(image, 'convert'):
-            image_array = np.array(image)
-        else:
-            image_array = image
-        
-        # Convert bbox to integer coordinates
-        bbox = [int(coord) for coord in bbox]
-        
-        # Extract the cell region
-        x_coords = bbox[::2]  # x coordinates
-        y_coords = bbox[1::2]  # y coordinates
-        
-        x1, x2 = min(x_coords), max(x_coords)
-        y1, y2 = min(y_coords), max(y_coords)
-        
-        # Ensure coordinates are within image bounds
-        height, width = image_array.shape[:2]
-        x1 = max(0, min(x1, width))
-        x2 = max(0, min(x2, width))
-        y1 = max(0, min(y1, height))
-        y2 = max(0, min(y2, height))
-        
-        # Extract cell region
-        cell_region = image_array[y1:y2, x1:x2]
-        
-        if cell_region.size == 0:
-            return ""
-        
-        # Use OCR to extract text
-        if ocr_reader is not None:
-            if EASYOCR_AVAILABLE and isinstance(ocr_reader, easyocr.Reader):
-                results = ocr_reader.readtext(cell_region)
-                if results:
-                    # Combine all detected text
-                    text_parts = [result[1] for result in results]
-                    return " ".join(text_parts)
-            
-            elif PADDLEOCR_AVAILABLE and isinstance(ocr_reader, PaddleOCR):
-                results = ocr_reader.ocr(cell_region, cls=False)
-                if results and results[0]:
-                    # Extract text from results
-                    text_parts = [line[1][0] for line in results[0]]
-                    return " ".join(text_parts)
-        
+    # Convert PIL image to numpy array if needed
+    if hasattr(image, 'convert'):
+        image_array = np.asarray(image)
+    else:
+        image_array = image
+    
+    # Compute the cell bounds within the image
+    height, width = image_array.shape[:2]
+    x1, y1, x2, y2 = _clamped_bbox(np.asarray(bbox, dtype=np.int32), width, height)
+    
+    # Extract cell region
+    cell_region = image_array[y1:y2, x1:x2]
+    
+    if cell_region.size == 0 or ocr_reader is None:
         return ""
-        
-    except Exception as e:
-        logger.warning(f"Error extracting text from cell: {str(e)}")
+    
+    # Reuse the text of a pixel-identical cell seen earlier in this image
+    if text_cache is not None:
+        key = _cell_hash(cell_region)
+        if key in text_cache:
+            return text_cache[key]
+    
+    # Use OCR to extract text. A failing OCR backend on a single cell is
+    # common and not worth a log record per cell; leave the cell empty and
+    # let anything unexpected propagate to the per-image handler.
+    text = ""
+    try:
+        if EASYOCR_AVAILABLE and isinstance(ocr_reader, _get_easyocr()):
+            results = ocr_reader.readtext(cell_region)
+            if results:
+                # Combine all detected text
+                text = " ".join(result[1] for result in results)
+        
+        elif PADDLEOCR_AVAILABLE and isinstance(ocr_reader, _get_paddleocr()):
+            results = ocr_reader.ocr(cell_region, cls=False)
+            if results and results[0]:
+                # Extract text from results
+                text = " ".join(line[1][0] for line in results[0])
+    except (ValueError, RuntimeError, cv2.error):
         return ""
+    
+    if text_cache is not None:
+        text_cache[key] = text
+    return text
 
 def process_image_with_enhanced_rapidtable(image_path, output_dir):
     """
@@ -145,44 +307,18 @@ def process_image_with_enhanced_rapidtable(image_path, output_dir):
         
         logger.info(f"Processing {image_path} with Enhanced RapidTable + OCR...")
         
-        # Initialize RapidTable
-        rapid_table = RapidTable()
-        
         # Load and process image
         image = Image.open(image_path)
-        image_array = np.array(image)
-        
-        # Create input for RapidTable with configuration
-        input_data = RapidTableInput(
-            model_type=ModelType.PPSTRUCTURE_EN,
-            engine_type=EngineType.ONNXRUNTIME,
-            use_ocr=True
-        )
+        # Read-only view over the PIL buffer; nothing below writes to it
+        image_array = np.asarray(image)
         
         # Process the image with RapidTable
-        rapid_table.cfg = input_data
+        rapid_table = get_rapid_table()
         table_results = rapid_table.get_table_rec_results(image_array)
         
-        # Initialize OCR readers for content extraction
-        easyocr_reader = None
-        paddleocr_reader = None
-        
-        if EASYOCR_AVAILABLE:
-            try:
-                easyocr_reader = easyocr.Reader(['en', 'ch_sim'])
-                logger.info("EasyOCR initialized successfully")
-            except Exception as e:
-                logger.warning(f"Failed to initialize EasyOCR: {str(e)}")
-        
-        if PADDLEOCR_AVAILABLE:
-            try:
-                paddleocr_reader = PaddleOCR(use_angle_cls=True, lang='en')
-                logger.info("PaddleOCR initialized successfully")
-            except Exception as e:
-                logger.warning(f"Failed to initialize PaddleOCR: {str(e)}")
-        
         # Use the first available OCR reader
-        ocr_reader = easyocr_reader or paddleocr_reader
+        ocr_reader = get_ocr_reader()
+        cell_text_cache = {}
         
         # Extract table information with content
         markdown_content = f"# Image: {base_name}\n\n"
@@ -221,7 +357,8 @@ def process_image_with_enhanced_rapidtable(image_path, output_dir):
                                     cell_text = extract_text_from_cell_region(
                                         image_array, 
                                         bboxes[bbox_start], 
-                                        ocr_reader
+                                        ocr_reader,
+                                        cell_text_cache
                                     )
                                     table_row.append(cell_text.strip() if cell_text.strip() else " ")
                                 else:
@@ -300,30 +437,18 @@ def process_image_with_rapidtable_plus_surya(image_path, output_dir):
         
         logger.info(f"Processing {image_path} with RapidTable + Surya OCR...")
         
-        # Initialize RapidTable
-        rapid_table = RapidTable()
-        
         # Load and process image
         image = Image.open(image_path)
-        image_array = np.array(image)
-        
-        # Create input for RapidTable with configuration
-        input_data = RapidTableInput(
-            model_type=ModelType.PPSTRUCTURE_EN,
-            engine_type=EngineType.ONNXRUNTIME,
-            use_ocr=True
-        )
+        # Read-only view over the PIL buffer; nothing below writes to it
+        image_array = np.asarray(image)
         
         # Process the image with RapidTable
-        rapid_table.cfg = input_data
+        rapid_table = get_rapid_table()
         table_results = rapid_table.get_table_rec_results(image_array)
         
         # Initialize Surya OCR for content extraction
         try:
-            detection_model = DetectionPredictor()
-            recognition_model = RecognitionPredictor()
-            layout_model = LayoutPredictor()
-            logger.info("Surya OCR models initialized successfully")
+            detection_model, recognition_model, layout_model = get_surya_models()
         except Exception as e:
             logger.warning(f"Failed to initialize Surya OCR: {str(e)}")
             return False
@@ -442,9 +567,160 @@ def process_image_with_rapidtable_plus_surya(image_path, output_dir):
         logger.error(f"Error processing {image_path} with RapidTable + Surya: {str(e)}")
         return False
 
+def process_image(image_path, output_dir):
+    """
+    Run both table pipelines on a single image.
+    
+    Args:
+        image_path (str): Path to the input image
+        output_dir (str): Directory to save the markdown output
+    
+    Returns:
+        tuple: (enhanced_success, surya_success)
+    """
+    # Try Enhanced RapidTable + OCR, then RapidTable + Surya OCR
+    enhanced_ok = process_image_with_enhanced_rapidtable(image_path, output_dir)
+    surya_ok = process_image_with_rapidtable_plus_surya(image_path, output_dir)
+    return enhanced_ok, surya_ok
+
+def warm_up_engines():
+    """Load every available engine so the first image does not pay for model init."""
+    if RAPIDTABLE_AVAILABLE:
+        get_rapid_table()
+        get_ocr_reader()
+        if SURYA_AVAILABLE:
+            try:
+                get_surya_models()
+            except Exception as e:
+                logger.warning(f"Failed to initialize Surya OCR: {str(e)}")
+
+DEFAULT_SERVER_PORT = 5555
+# Shared secret for the engine server: taken from this environment variable
+# if set, otherwise generated by the server into a file only the user can read
+SERVER_AUTHKEY_ENV = "OMNIPARSE_OCR_SERVER_AUTHKEY"
+
+def _server_authkey_path(port):
+    return os.path.join(os.path.expanduser("~"), f".omniparse_ocr_server_{port}.key")
+
+def _server_authkey(port, create=False):
+    """
+    Return the engine server's authkey.
+    
+    Args:
+        port (int): Local TCP port of the server (each port has its own key file)
+        create (bool): Generate a fresh random key and write it to the key file
+    
+    Returns:
+        bytes: The authkey, or None if there is no key to read
+    """
+    env_key = os.environ.get(SERVER_AUTHKEY_ENV)
+    if env_key:
+        return env_key.encode()
+    
+    key_path = _server_authkey_path(port)
+    if create:
+        authkey = os.urandom(32).hex().encode()
+        fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            # O_CREAT's mode does not apply to a file that already exists
+            os.fchmod(fd, 0o600)
+            os.write(fd, authkey)
+        finally:
+            os.close(fd)
+        return authkey
+    
+    try:
+        with open(key_path, 'rb') as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+class ImageProcessor:
+    """Server-side handle that runs image jobs on the engines loaded in this process."""
+    
+    def __init__(self):
+        # The OCR engines are not thread-safe; the manager serves each client
+        # connection on its own thread
+        self._lock = threading.Lock()
+    
+    def process(self, image_path, output_dir):
+        with self._lock:
+            return process_image(image_path, output_dir)
+
+_processor = None
+
+def _get_processor():
+    global _processor
+    if _processor is None:
+        _processor = ImageProcessor()
+    return _processor
+
+class EngineManager(BaseManager):
+    """Multiprocessing manager exposing a long-running ImageProcessor."""
+
+EngineManager.register('get_processor', callable=_get_processor)
+
+def serve(port=DEFAULT_SERVER_PORT):
+    """
+    Keep the engines loaded and process image jobs sent by CLI clients.
+    
+    Args:
+        port (int): Local TCP port to listen on
+    """
+    authkey = _server_authkey(port, create=True)
+    warm_up_engines()
+    manager = EngineManager(address=('127.0.0.1', port), authkey=authkey)
+    server = manager.get_server()
+    logger.info(f"OCR engine server listening on 127.0.0.1:{port}")
+    server.serve_forever()
+
+def connect_to_server(port=DEFAULT_SERVER_PORT):
+    """
+    Connect to a running engine server.
+    
+    Args:
+        port (int): Local TCP port the server listens on
+    
+    Returns:
+        Proxy to the server's ImageProcessor, or None if no server could be used
+    """
+    authkey = _server_authkey(port)
+    if authkey is None:
+        logger.warning(f"No engine server key (set {SERVER_AUTHKEY_ENV} or start the server with --serve)")
+        return None
+    manager = EngineManager(address=('127.0.0.1', port), authkey=authkey)
+    try:
+        manager.connect()
+    except AuthenticationError:
+        logger.warning(f"Listener on port {port} rejected the engine server key")
+        return None
+    except OSError:
+        logger.warning(f"No engine server running on port {port}")
+        return None
+    return manager.get_processor()
+
 def main():
     """Main function to process OmniDocBench demo images with enhanced table recognition."""
     
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--serve', action='store_true',
+                        help='Run as a long-lived server that keeps the OCR engines loaded')
+    parser.add_argument('--use-server', action='store_true',
+                        help='Send images to a running engine server instead of loading the engines here')
+    parser.add_argument('--port', type=int, default=DEFAULT_SERVER_PORT,
+                        help='Local port of the engine server')
+    parser.add_argument('--quantize-table-model', nargs=2, metavar=('SRC', 'DST'),
+                        help='Write an int8 copy of the RapidTable ONNX model and exit')
+    args = parser.parse_args()
+    
+    if args.quantize_table_model:
+        quantize_table_model(*args.quantize_table_model)
+        return
+    
+    if args.serve:
+        serve(args.port)
+        return
+    
     # Define paths
     demo_images_dir = "demo_data/omnidocbench_demo/images"
     output_dir = "omniparse_enhanced_ocr_results"
@@ -472,15 +748,25 @@ def main():
     successful_surya = 0
     failed = 0
     
+    # On request, hand the work to a running engine server so the models do
+    # not have to be reloaded for this invocation
+    processor = connect_to_server(args.port) if args.use_server else None
+    if args.use_server and processor is None:
+        logger.warning("Falling back to local processing")
+    if processor is not None:
+        logger.info(f"Using OCR engine server on port {args.port}")
+        process = processor.process
+        output_dir = os.path.abspath(output_dir)
+    else:
+        process = process_image
+    
     for image_file in image_files:
-        image_path = str(image_file)
+        image_path = os.path.abspath(image_file)
         
-        # Try Enhanced RapidTable + OCR
-        if process_image_with_enhanced_rapidtable(image_path, output_dir):
+        enhanced_ok, surya_ok = process(image_path, output_dir)
+        if enhanced_ok:
             successful_enhanced += 1
-        
-        # Try RapidTable + Surya OCR
-        if process_image_with_rapidtable_plus_surya(image_path, output_dir):
+        if surya_ok:
             successful_surya += 1
         
         failed += 1  # Count attempts
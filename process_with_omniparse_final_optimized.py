@@ -6,10 +6,17 @@ This script combines the best of both approaches: RapidTable's structure detecti
 
 import os
 import sys
+import argparse
+import functools
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 import logging
 from PIL import Image
 import numpy as np
+import cv2
 
 # Import OmniParse components
 try:
@@ -62,6 +69,217 @@ except ImportError:
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Per-cell crop OCR is only the fallback: normally cell text comes from the
+# full-page EasyOCR pass (see _assign_text_to_cells), and cells are cropped
+# and re-read only when that pass is unavailable or failed. The two settings
+# below apply to that fallback alone.
+
+# Order in which fallback cell OCR tries the readers, typically fastest first
+# (comma-separated names, e.g. OCR_READER_ORDER=PaddleOCR,EasyOCR)
+OCR_READER_ORDER = os.environ.get("OCR_READER_ORDER", "EasyOCR,PaddleOCR").split(",")
+
+# Fallback cell OCR stops trying further readers once a result is at least
+# this confident
+CONFIDENT_OCR_THRESHOLD = 0.9
+
+# Serializes first-time model construction when several pipeline threads
+# ask for the same model concurrently
+_MODEL_INIT_LOCK = threading.Lock()
+
+# PaddleOCR's predictor is not safe to call from several threads at once;
+# RapidTable (ONNX Runtime) is, and EasyOCR readers are kept per thread
+_PADDLEOCR_LOCK = threading.Lock()
+
+# Per-thread model instances (currently the EasyOCR reader)
+_THREAD_MODELS = threading.local()
+
+# Default worker threads. Each one loads (and on a GPU warms up) its own
+# EasyOCR reader, so the default stays small however many cores there are
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+
+def _get_easyocr():
+    """
+    Get this thread's EasyOCR reader, loading it on first use.
+    
+    Each worker thread owns its reader so concurrent OCR calls do not
+    serialize on one shared PyTorch model.
+    
+    Returns:
+        easyocr.Reader, or None if EasyOCR is unavailable
+    """
+    if not hasattr(_THREAD_MODELS, "easyocr"):
+        # A reader that fails to load is remembered as None for this thread
+        _THREAD_MODELS.easyocr = _create_easyocr()
+    return _THREAD_MODELS.easyocr
+
+def _create_easyocr():
+    """Load an EasyOCR reader; None if it is unavailable."""
+    if not EASYOCR_AVAILABLE:
+        return None
+    try:
+        import torch
+        use_gpu = torch.cuda.is_available()
+        reader = easyocr.Reader(
+            ['en', 'ch_sim'], gpu=use_gpu, quantize=True, cudnn_benchmark=True, verbose=False
+        )
+        if use_gpu:
+            # Let cuDNN benchmark its kernels on a dummy batch rather than on
+            # the first real page
+            reader.readtext_batched(np.zeros((32, 64, 256, 3), dtype=np.uint8), n_width=256, n_height=64)
+        logger.info(f"EasyOCR initialized successfully (GPU: {use_gpu})")
+        return reader
+    except Exception as e:
+        logger.warning(f"Failed to initialize EasyOCR: {str(e)}")
+        return None
+
+@functools.lru_cache(maxsize=1)
+def _get_paddleocr():
+    """Load the PaddleOCR reader once per process; None if it is unavailable."""
+    if not PADDLEOCR_AVAILABLE:
+        return None
+    try:
+        reader = PaddleOCR(use_textline_orientation=True, lang='en')
+        logger.info("PaddleOCR initialized successfully")
+        return reader
+    except Exception as e:
+        logger.warning(f"Failed to initialize PaddleOCR: {str(e)}")
+        return None
+
+# Number of threads that call the shared RapidTable session concurrently;
+# main() sets it from --workers before the session is created
+_rapid_table_callers = 1
+
+def set_rapid_table_callers(callers):
+    """Split the cores between this many concurrent RapidTable callers (call before first use)."""
+    global _rapid_table_callers
+    _rapid_table_callers = max(1, callers)
+
+def _rapid_table_engine_cfg():
+    """
+    ONNX Runtime settings for the RapidTable session: CUDA when available,
+    and the cores divided between the threads sharing the session so that
+    concurrent runs do not oversubscribe the CPU.
+    """
+    use_cuda = False
+    try:
+        import onnxruntime
+        use_cuda = "CUDAExecutionProvider" in onnxruntime.get_available_providers()
+    except ImportError:
+        pass
+    intra_op_threads = max(1, (os.cpu_count() or 1) // _rapid_table_callers)
+    return {"intra_op_num_threads": intra_op_threads, "use_cuda": use_cuda}
+
+@functools.lru_cache(maxsize=1)
+def _get_rapid_table():
+    """Create the configured RapidTable engine once per process."""
+    engine_cfg = _rapid_table_engine_cfg()
+    cfg = RapidTableInput(
+        model_type=ModelType.PPSTRUCTURE_EN,
+        engine_type=EngineType.ONNXRUNTIME,
+        engine_cfg=engine_cfg,
+        use_ocr=True
+    )
+    # The ONNX session is built from the constructor config
+    rapid_table = RapidTable(cfg)
+    logger.info(f"RapidTable initialized (CUDA: {engine_cfg['use_cuda']})")
+    return rapid_table
+
+def get_rapid_table():
+    """Get the process-wide RapidTable engine, creating it on first use."""
+    with _MODEL_INIT_LOCK:
+        return _get_rapid_table()
+
+def get_ocr_readers():
+    """
+    Get the OCR readers for the calling thread, loading them on first use.
+    
+    EasyOCR is per thread; PaddleOCR is shared by the process.
+    
+    Returns:
+        dict: OCR reader objects keyed by name ("EasyOCR", "PaddleOCR"), in
+        OCR_READER_ORDER
+    """
+    with _MODEL_INIT_LOCK:
+        paddleocr_reader = _get_paddleocr() if "PaddleOCR" in OCR_READER_ORDER else None
+    candidates = {
+        "EasyOCR": _get_easyocr() if "EasyOCR" in OCR_READER_ORDER else None,
+        "PaddleOCR": paddleocr_reader,
+    }
+    return {
+        name: candidates[name] for name in OCR_READER_ORDER
+        if candidates.get(name) is not None
+    }
+
+def _crop_cells(image_array, bboxes):
+    """
+    Crop cell regions out of an image.
+    
+    Args:
+        image_array: numpy array of the image
+        bboxes: List of bounding boxes [x1, y1, x2, y2, x3, y3, x4, y4]
+    
+    Returns:
+        list: numpy array of each cell region, or None where the region is empty
+    """
+    if len(bboxes) == 0:
+        return []
+    
+    # Convert all bboxes to integer (x, y) points at once
+    points = np.asarray(bboxes, dtype=np.float64).astype(np.int32).reshape(len(bboxes), -1, 2)
+    
+    # Cell rectangles clipped to the image
+    height, width = image_array.shape[:2]
+    x1y1 = np.maximum(points.min(axis=1), 0)
+    x2y2 = np.minimum(points.max(axis=1), [width, height])
+    
+    crops = []
+    for (x1, y1), (x2, y2) in zip(x1y1.tolist(), x2y2.tolist()):
+        # Ensure we have a valid region
+        crops.append(image_array[y1:y2, x1:x2] if x2 > x1 and y2 > y1 else None)
+    return crops
+
+def _combine_easyocr_results(results):
+    """Join EasyOCR (bbox, text, confidence) results into (text, average confidence)."""
+    if not results:
+        return "", 0.0
+    text_parts = [result[1] for result in results]
+    total_confidence = sum(result[2] for result in results)
+    return " ".join(text_parts), total_confidence / len(results)
+
+def _combine_paddleocr_results(results):
+    """Join PaddleOCR results into (text, average confidence)."""
+    if not results or not results[0]:
+        return "", 0.0
+    text_parts = []
+    total_confidence = 0
+    for line in results[0]:
+        if len(line) >= 2:
+            text_parts.append(line[1][0])
+            if len(line[1]) >= 2:
+                total_confidence += line[1][1]
+    if not text_parts:
+        return "", 0.0
+    avg_confidence = total_confidence / len(text_parts) if total_confidence > 0 else 0.5
+    return " ".join(text_parts), avg_confidence
+
+# Pipes in cell text are almost always a misread "I". Digits are left alone:
+# mapping 0/1 to O/l corrupts numeric table content.
+_PIPE_TO_I = str.maketrans({"|": "I"})
+
+def _clean_cell_text(text):
+    """Normalize whitespace and common OCR artifacts in extracted cell text."""
+    if not text:
+        return ""
+    # Remove extra whitespace and normalize
+    cleaned_text = " ".join(text.split())
+    # Remove common OCR artifacts
+    return cleaned_text.translate(_PIPE_TO_I)
+
+def _pad_to_shape(crop, height, width):
+    """Pad a crop at the bottom/right with white to the given size."""
+    padding = [(0, height - crop.shape[0]), (0, width - crop.shape[1])] + [(0, 0)] * (crop.ndim - 2)
+    return np.pad(crop, padding, mode='constant', constant_values=255)
+
 def extract_text_from_cell_region_simple(image, bbox, ocr_readers):
     """
     Simple and robust text extraction from cell regions.
@@ -74,397 +292,501 @@ def extract_text_from_cell_region_simple(image, bbox, ocr_readers):
     Returns:
         str: Extracted text from the cell
     """
+    return extract_text_from_cell_regions_batched(image, [bbox], ocr_readers)[0]
+
+def extract_text_from_cell_regions_batched(image, bboxes, ocr_readers):
+    """
+    Text extraction for all cells of a table at once.
+    
+    Used when no full-page OCR result is available to assign to the cells.
+    All cell crops are padded to a common size and recognized with a single
+    EasyOCR readtext_batched call instead of one call per cell; PaddleOCR is
+    still run per crop. Readers run in the order of ocr_readers, and a cell
+    whose text was already read with confidence >= CONFIDENT_OCR_THRESHOLD is
+    not passed to the later readers. For each cell the result with the
+    highest confidence is kept.
+    
+    Args:
+        image: PIL Image or numpy array
+        bboxes: List of bounding boxes [x1, y1, x2, y2, x3, y3, x4, y4]
+        ocr_readers: Dictionary of OCR reader objects
+    
+    Returns:
+        list: Extracted text for each bounding box
+    """
     try:
         # Convert PIL image to numpy array if needed
         if hasattr(image, 'convert'):
-            image_array = np.array(image)
+            image_array = np.asarray(image)
         else:
             image_array = image
         
-        # Convert bbox to integer coordinates
-        bbox = [int(coord) for coord in bbox]
-        
-        # Extract the cell region
-        x_coords = bbox[::2]  # x coordinates
-        y_coords = bbox[1::2]  # y coordinates
+        crops = _crop_cells(image_array, bboxes)
         
-        x1, x2 = max(0, min(x_coords)), min(image_array.shape[1], max(x_coords))
-        y1, y2 = max(0, min(y_coords)), min(image_array.shape[0], max(y_coords))
-        
-        # Ensure we have a valid region
-        if x2 <= x1 or y2 <= y1:
-            return ""
+    except Exception as e:
+        logger.warning(f"Error extracting text from cells: {str(e)}")
+        return [""] * len(bboxes)
+    
+    return extract_text_from_crops_batched(crops, ocr_readers)
+
+def extract_text_from_crops_batched(crops, ocr_readers):
+    """
+    Run the OCR readers over already cropped cell images as one batch.
+    
+    The crops may come from different images; see
+    extract_text_from_cell_regions_batched for how the readers are combined.
+    
+    Args:
+        crops: List of cell images (numpy arrays); None or empty entries yield ""
+        ocr_readers: Dictionary of OCR reader objects
+    
+    Returns:
+        list: Extracted text for each crop
+    """
+    try:
+        valid = [i for i, crop in enumerate(crops) if crop is not None and crop.size > 0]
         
-        # Extract cell region
-        cell_region = image_array[y1:y2, x1:x2]
+        # Try multiple OCR strategies
+        best_text = [""] * len(crops)
+        best_confidence = [0.0] * len(crops)
         
-        if cell_region.size == 0:
-            return ""
+        def keep_best(i, text, confidence):
+            if text and confidence > best_confidence[i]:
+                best_text[i] = text
+                best_confidence[i] = confidence
         
-        # Try multiple OCR strategies
-        best_text = ""
-        best_confidence = 0.0
+        if not valid:
+            return best_text
         
         for reader_name, reader in ocr_readers.items():
+            # Cells already read with high confidence skip the remaining readers
+            pending = [i for i in valid if best_confidence[i] < CONFIDENT_OCR_THRESHOLD]
+            if not pending:
+                break
             try:
                 if reader_name == "EasyOCR" and EASYOCR_AVAILABLE:
-                    results = reader.readtext(cell_region)
-                    if results:
-                        # Combine all detected text with confidence
-                        text_parts = []
-                        total_confidence = 0
-                        for result in results:
-                            text_parts.append(result[1])
-                            total_confidence += result[2]
-                        
-                        avg_confidence = total_confidence / len(results)
-                        combined_text = " ".join(text_parts)
-                        
-                        if avg_confidence > best_confidence:
-                            best_text = combined_text
-                            best_confidence = avg_confidence
+                    # Pad every crop to one shape (rounded up to 32 px) so the
+                    # recognizer can run them as a single batch
+                    height = -(-max(crops[i].shape[0] for i in pending) // 32) * 32
+                    width = -(-max(crops[i].shape[1] for i in pending) // 32) * 32
+                    batch = [_pad_to_shape(crops[i], height, width) for i in pending]
+                    batch_results = reader.readtext_batched(
+                        batch, n_width=width, n_height=height, batch_size=32
+                    )
+                    for i, results in zip(pending, batch_results):
+                        keep_best(i, *_combine_easyocr_results(results))
                 
                 elif reader_name == "PaddleOCR" and PADDLEOCR_AVAILABLE:
-                    results = reader.ocr(cell_region, cls=False)
-                    if results and results[0]:
-                        # Extract text from results
-                        text_parts = []
-                        total_confidence = 0
-                        for line in results[0]:
-                            if len(line) >= 2:
-                                text_parts.append(line[1][0])
-                                if len(line[1]) >= 2:
-                                    total_confidence += line[1][1]
-                        
-                        if text_parts:
-                            avg_confidence = total_confidence / len(text_parts) if total_confidence > 0 else 0.5
-                            combined_text = " ".join(text_parts)
-                            
-                            if avg_confidence > best_confidence:
-                                best_text = combined_text
-                                best_confidence = avg_confidence
+                    with _PADDLEOCR_LOCK:
+                        for i in pending:
+                            results = reader.ocr(crops[i], cls=False)
+                            keep_best(i, *_combine_paddleocr_results(results))
                 
             except Exception as e:
-                logger.debug(f"OCR reader {reader_name} failed for cell: {str(e)}")
+                logger.debug(f"OCR reader {reader_name} failed for cells: {str(e)}")
                 continue
         
         # Clean up the extracted text
-        if best_text:
-            # Remove extra whitespace and normalize
-            cleaned_text = " ".join(best_text.split())
-            # Remove common OCR artifacts
-            cleaned_text = cleaned_text.replace("|", "I").replace("0", "O").replace("1", "l")
-            return cleaned_text
+        return [_clean_cell_text(text) for text in best_text]
         
-        return ""
+    except Exception as e:
+        logger.warning(f"Error extracting text from cells: {str(e)}")
+        return [""] * len(crops)
+
+# The cell OCR batcher runs the recognizers once this many crops are queued,
+# or once the first queued crop has waited this long (seconds)
+OCR_MICRO_BATCH_SIZE = 32
+OCR_MICRO_BATCH_WAIT = 0.05
+
+# Longest a page waits for one of its cell OCR results (seconds)
+OCR_CELL_RESULT_TIMEOUT = 300
+
+class CellOCRBatcher:
+    """
+    Collects cell crops from concurrent callers and OCRs them in shared batches.
+    
+    Pages processed on different threads submit their crops to one queue; a
+    single consumer thread fires a batch when OCR_MICRO_BATCH_SIZE crops are
+    waiting or the oldest has waited OCR_MICRO_BATCH_WAIT seconds, so small
+    tables from several pages fill one recognizer call. A failed batch fails
+    only its own futures; if the consumer thread exits, every pending future
+    fails and later submits raise.
+    """
+    
+    def __init__(self, max_batch=OCR_MICRO_BATCH_SIZE, max_wait=OCR_MICRO_BATCH_WAIT):
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="cell-ocr", daemon=True)
+        self._thread.start()
+    
+    def submit(self, crops):
+        """
+        Queue cell crops for recognition.
         
+        Args:
+            crops: List of cell images (numpy arrays or None)
+        
+        Returns:
+            list: One Future per crop resolving to its extracted text
+        """
+        if not self._thread.is_alive():
+            raise RuntimeError("cell OCR batcher thread has exited")
+        futures = []
+        for crop in crops:
+            future = Future()
+            self._queue.put((crop, future))
+            futures.append(future)
+        return futures
+    
+    def _run(self):
+        items = []
+        try:
+            while True:
+                items = [self._queue.get()]
+                deadline = time.monotonic() + self.max_wait
+                while len(items) < self.max_batch:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        items.append(self._queue.get(timeout=remaining))
+                    except queue.Empty:
+                        break
+                
+                try:
+                    texts = extract_text_from_crops_batched([crop for crop, _ in items], get_ocr_readers())
+                except Exception as e:
+                    for _, future in items:
+                        future.set_exception(e)
+                    continue
+                # Route each result back to the page that submitted it
+                for (_, future), text in zip(items, texts):
+                    future.set_result(text)
+        finally:
+            # Nothing will serve these any more; fail them rather than leave
+            # their pages waiting
+            error = RuntimeError("cell OCR batcher thread has exited")
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(error)
+            while True:
+                try:
+                    _, future = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                future.set_exception(error)
+
+@functools.lru_cache(maxsize=1)
+def _get_cell_batcher():
+    """Start the process-wide cell OCR batcher."""
+    return CellOCRBatcher()
+
+def get_cell_batcher():
+    """Get the process-wide cell OCR batcher, starting it on first use."""
+    with _MODEL_INIT_LOCK:
+        return _get_cell_batcher()
+
+# One markdown table row; cells are joined with " | "
+_MD_ROW = "| %s |"
+
+def _markdown_table(rows):
+    """Render rows of cell strings as a markdown table, using the first row as the header."""
+    row_lines = [_MD_ROW % " | ".join(row) for row in rows]
+    row_lines.insert(1, _MD_ROW % " | ".join("---" for _ in rows[0]))
+    return "\n".join(row_lines) + "\n"
+
+def write_markdown_file(output_path, markdown_parts):
+    """
+    Write markdown parts to a file in one buffered pass.
+    
+    Args:
+        output_path (str): Path of the markdown file
+        markdown_parts (list): Markdown text fragments, in order
+    """
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.writelines(markdown_parts)
+
+def load_image(image_path):
+    """
+    Load an image from disk as an RGB numpy array.
+    
+    OpenCV decodes straight into a uint8 array; PIL is only used for formats
+    OpenCV cannot read.
+    
+    Args:
+        image_path (str): Path to the input image
+    
+    Returns:
+        numpy array of the image
+    """
+    image_array = cv2.imread(str(image_path), cv2.IMREAD_COLOR)
+    if image_array is None:
+        # Fall back to PIL for formats OpenCV cannot decode
+        return np.asarray(Image.open(image_path).convert('RGB'))
+    return cv2.cvtColor(image_array, cv2.COLOR_BGR2RGB)
+
+def recognize_table_structure(image_array):
+    """
+    Run RapidTable structure recognition on an image.
+    
+    Args:
+        image_array: numpy array of the image
+    
+    Returns:
+        tuple: RapidTable results (html_tokens, bboxes, cell_indices)
+    """
+    return get_rapid_table().get_table_rec_results(image_array)
+
+def detect_text(image_array):
+    """
+    Run EasyOCR over the whole page.
+    
+    Args:
+        image_array: numpy array of the image
+    
+    Returns:
+        list: EasyOCR (bbox, text, confidence) results, or None if EasyOCR is
+        not available
+    """
+    # Independent of OCR_READER_ORDER, which only orders the crop fallback
+    reader = _get_easyocr()
+    if reader is None:
+        return None
+    try:
+        return reader.readtext(image_array)
     except Exception as e:
-        logger.warning(f"Error extracting text from cell: {str(e)}")
-        return ""
+        logger.warning(f"EasyOCR text extraction failed: {str(e)}")
+        return None
+
+def analyze_image(image_path):
+    """
+    Run the per-image model work shared by both markdown outputs once.
+    
+    Args:
+        image_path (str): Path to the input image
+    
+    Returns:
+        tuple: (image_array, table_results, text_results) where table_results
+        is None if RapidTable is unavailable or failed, and text_results is
+        the full-page EasyOCR result or None
+    """
+    image_array = load_image(image_path)
+    table_results = None
+    if RAPIDTABLE_AVAILABLE:
+        try:
+            table_results = recognize_table_structure(image_array)
+        except Exception as e:
+            logger.error(f"Error processing {image_path} with RapidTable + Hybrid OCR: {str(e)}")
+    return image_array, table_results, detect_text(image_array)
+
+def _assign_text_to_cells(cell_bboxes, text_results):
+    """
+    Distribute full-page EasyOCR text into table cells.
+    
+    Each text element goes to every cell whose bounding rectangle contains
+    the element's centre; a cell's texts are joined in reading order.
+    
+    Args:
+        cell_bboxes: List of cell bounding boxes [x1, y1, x2, y2, x3, y3, x4, y4]
+        text_results: EasyOCR (bbox, text, confidence) results for the page
+    
+    Returns:
+        list: Text for each cell
+    """
+    if not cell_bboxes or not text_results:
+        return [""] * len(cell_bboxes)
+    
+    # Text element centres, sorted top-to-bottom then left-to-right
+    centers = np.asarray([result[0] for result in text_results], dtype=np.float32).mean(axis=1)
+    order = np.lexsort((centers[:, 0], centers[:, 1]))
+    centers = centers[order]
+    
+    # Cell rectangles as (min_xy, max_xy)
+    cells = np.asarray(cell_bboxes, dtype=np.float32).reshape(len(cell_bboxes), -1, 2)
+    low, high = cells.min(axis=1), cells.max(axis=1)
+    
+    # inside[c, t]: text element t lies in cell c
+    inside = ((centers[None] >= low[:, None]) & (centers[None] <= high[:, None])).all(axis=2)
+    return [
+        _clean_cell_text(" ".join(text_results[t][1] for t in order[cell_mask]))
+        for cell_mask in inside
+    ]
 
-def process_image_with_rapidtable_plus_hybrid_ocr(image_path, output_dir):
+def process_image_with_rapidtable_plus_hybrid_ocr(image_path, output_dir, text_results=None, image_array=None):
     """
     Process a single image with RapidTable + Hybrid OCR for optimal table recognition.
     
     Args:
         image_path (str): Path to the input image
         output_dir (str): Directory to save the markdown output
+        text_results: Full-page EasyOCR results to fill the cells from, if
+            already computed
+        image_array: Already decoded image; loaded from image_path when omitted
     """
     try:
         if not RAPIDTABLE_AVAILABLE:
             logger.error("RapidTable not available")
             return False
-            
-        # Get the base filename without extension
-        base_name = Path(image_path).stem
         
         logger.info(f"Processing {image_path} with RapidTable + Hybrid OCR...")
         
-        # Initialize RapidTable
-        rapid_table = RapidTable()
-        
         # Load image
-        image = Image.open(image_path)
-        image_array = np.array(image)
-        
-        # Create input for RapidTable with configuration
-        input_data = RapidTableInput(
-            model_type=ModelType.PPSTRUCTURE_EN,
-            engine_type=EngineType.ONNXRUNTIME,
-            use_ocr=True
-        )
+        if image_array is None:
+            image_array = load_image(image_path)
         
         # Process the image with RapidTable
-        rapid_table.cfg = input_data
-        table_results = rapid_table.get_table_rec_results(image_array)
-        
-        # Initialize OCR readers
-        ocr_readers = {}
+        table_results = recognize_table_structure(image_array)
         
-        if EASYOCR_AVAILABLE:
-            try:
-                easyocr_reader = easyocr.Reader(['en', 'ch_sim'], gpu=False)
-                ocr_readers["EasyOCR"] = easyocr_reader
-                logger.info("EasyOCR initialized successfully")
-            except Exception as e:
-                logger.warning(f"Failed to initialize EasyOCR: {str(e)}")
+        output_path = write_optimized_table_markdown(
+            image_path, image_array, table_results, output_dir, text_results=text_results
+        )
         
-        if PADDLEOCR_AVAILABLE:
-            try:
-                paddleocr_reader = PaddleOCR(use_textline_orientation=True, lang='en')
-                ocr_readers["PaddleOCR"] = paddleocr_reader
-                logger.info("PaddleOCR initialized successfully")
-            except Exception as e:
-                logger.warning(f"Failed to initialize PaddleOCR: {str(e)}")
+        logger.info(f"Successfully processed {image_path} -> {output_path}")
+        return True
         
-        # Extract table information with hybrid content
-        markdown_content = f"# Image: {base_name}\n\n"
-        markdown_content += "## Optimized Table Recognition Results (RapidTable + Hybrid OCR)\n\n"
+    except Exception as e:
+        logger.error(f"Error processing {image_path} with RapidTable + Hybrid OCR: {str(e)}")
+        return False
+
+def write_optimized_table_markdown(image_path, image_array, table_results, output_dir, text_results=None,
+                                   write=write_markdown_file):
+    """
+    Fill the RapidTable cells with Hybrid OCR text and save the markdown output.
+    
+    Args:
+        image_path (str): Path to the input image
+        image_array: numpy array of the image used for cell OCR
+        table_results: RapidTable results for the image
+        output_dir (str): Directory to save the markdown output
+        text_results: Full-page EasyOCR results; when given, cells take their
+            text from it instead of being cropped and OCR'd one by one
+        write: Callable taking (output_path, markdown_parts) that saves the file
+    
+    Returns:
+        str: Path of the written markdown file
+    """
+    # Get the base filename without extension
+    base_name = Path(image_path).stem
+    
+    # Extract table information with hybrid content
+    markdown_parts = [
+        f"# Image: {base_name}\n\n",
+        "## Optimized Table Recognition Results (RapidTable + Hybrid OCR)\n\n",
+    ]
+    
+    if table_results and len(table_results) > 0:
+        html_tokens, bboxes, cell_indices = table_results
         
-        if table_results and len(table_results) > 0:
-            html_tokens, bboxes, cell_indices = table_results
+        if html_tokens and bboxes is not None and len(bboxes) > 0:
+            markdown_parts.append("### Table Structure Detected\n\n")
             
-            if html_tokens and bboxes is not None and len(bboxes) > 0:
-                markdown_content += "### Table Structure Detected\n\n"
+            # Create a proper markdown table with extracted content
+            if cell_indices is not None and len(cell_indices) > 0:
+                # Group cells by row and column
+                cell_grid = {}
+                max_row = 0
+                max_col = 0
                 
-                # Create a proper markdown table with extracted content
-                if cell_indices is not None and len(cell_indices) > 0:
-                    # Group cells by row and column
-                    cell_grid = {}
-                    max_row = 0
-                    max_col = 0
-                    
-                    for cell_idx in cell_indices:
-                        if len(cell_idx) >= 4:
-                            row, col = cell_idx[0], cell_idx[1]
-                            max_row = max(max_row, row)
-                            max_col = max(max_col, col)
-                            cell_grid[(row, col)] = cell_idx[2:4]  # Store bbox indices
-                    
-                    # Extract text for each cell with hybrid OCR
-                    table_content = []
-                    for row in range(max_row + 1):
-                        table_row = []
-                        for col in range(max_col + 1):
-                            if (row, col) in cell_grid:
-                                bbox_start, bbox_end = cell_grid[(row, col)]
-                                if bbox_start < len(bboxes) and bbox_end < len(bboxes):
-                                    # Extract text from this cell using hybrid OCR
-                                    cell_text = extract_text_from_cell_region_simple(
-                                        image_array, 
-                                        bboxes[bbox_start], 
-                                        ocr_readers
-                                    )
-                                    table_row.append(cell_text.strip() if cell_text.strip() else " ")
-                                else:
-                                    table_row.append(" ")
-                            else:
-                                table_row.append(" ")
-                        table_content.append(table_row)
-                    
-                    # Convert to markdown table
-                    if table_content:
-                        markdown_content += "**Extracted Table Content (Hybrid OCR):**\n\n"
-                        
-                        # Header row
-                        markdown_content += "| " + " | ".join(cell or " " for cell in table_content[0]) + " |\n"
-                        markdown_content += "| " + " | ".join("---" for _ in table_content[0]) + " |\n"
-                        
-                        # Data rows
-                        for row in table_content[1:]:
-                            markdown_content += "| " + " | ".join(cell or " " for cell in row) + " |\n"
-                        
-                        markdown_content += "\n"
+                for cell_idx in cell_indices:
+                    if len(cell_idx) >= 4:
+                        row, col = cell_idx[0], cell_idx[1]
+                        max_row = max(max_row, row)
+                        max_col = max(max_col, col)
+                        cell_grid[(row, col)] = cell_idx[2:4]  # Store bbox indices
                 
-                # Add table metadata
-                markdown_content += f"**Number of detected cells**: {len(bboxes)}\n\n"
-                markdown_content += f"**Table dimensions**: {max_row + 1} rows × {max_col + 1} columns\n\n"
+                # Collect every cell with a valid bbox (in row-major order),
+                # then OCR them as one batch
+                cell_keys = []
+                cell_bboxes = []
+                for row in range(max_row + 1):
+                    for col in range(max_col + 1):
+                        if (row, col) in cell_grid:
+                            bbox_start, bbox_end = cell_grid[(row, col)]
+                            if bbox_start < len(bboxes) and bbox_end < len(bboxes):
+                                cell_keys.append((row, col))
+                                cell_bboxes.append(bboxes[bbox_start])
                 
-                # Add HTML structure for reference
-                markdown_content += "**Table Structure (HTML):**\n"
-                markdown_content += "```html\n"
-                markdown_content += "".join(html_tokens) + "\n"
-                markdown_content += "```\n\n"
+                if text_results is not None:
+                    # Reuse the full-page OCR pass instead of re-reading each cell
+                    cell_texts = _assign_text_to_cells(cell_bboxes, text_results)
+                else:
+                    # Cells from concurrently processed pages share OCR batches
+                    cell_futures = get_cell_batcher().submit(_crop_cells(image_array, cell_bboxes))
+                    cell_texts = [future.result(timeout=OCR_CELL_RESULT_TIMEOUT) for future in cell_futures]
                 
-                # Show sample cell bounding boxes
-                markdown_content += "**Sample Cell Bounding Boxes:**\n"
-                for i, bbox in enumerate(bboxes[:5]):  # Show first 5
-                    markdown_content += f"- Cell {i+1}: {bbox}\n"
-                if len(bboxes) > 5:
-                    markdown_content += f"- ... and {len(bboxes) - 5} more cells\n"
-                markdown_content += "\n"
+                # Scatter the results back into the table grid
+                table_content = [[" "] * (max_col + 1) for _ in range(max_row + 1)]
+                for (row, col), cell_text in zip(cell_keys, cell_texts):
+                    table_content[row][col] = cell_text.strip() if cell_text.strip() else " "
                 
-            else:
-                markdown_content += "No table structure detected in this image.\n\n"
+                # Convert to markdown table
+                if table_content:
+                    markdown_parts.append("**Extracted Table Content (Hybrid OCR):**\n\n")
+                    
+                    # Header row, separator and data rows in one join
+                    markdown_parts.append(_markdown_table(
+                        [[cell or " " for cell in row] for row in table_content]
+                    ))
+                    
+                    markdown_parts.append("\n")
+            
+            # Add table metadata
+            markdown_parts.append(f"**Number of detected cells**: {len(bboxes)}\n\n")
+            markdown_parts.append(f"**Table dimensions**: {max_row + 1} rows × {max_col + 1} columns\n\n")
+            
+            # Add HTML structure for reference
+            markdown_parts.append("**Table Structure (HTML):**\n")
+            markdown_parts.append("```html\n")
+            markdown_parts.append("".join(html_tokens) + "\n")
+            markdown_parts.append("```\n\n")
+            
+            # Show sample cell bounding boxes
+            markdown_parts.append("**Sample Cell Bounding Boxes:**\n")
+            for i, bbox in enumerate(bboxes[:5]):  # Show first 5
+                markdown_parts.append(f"- Cell {i+1}: {bbox}\n")
+            if len(bboxes) > 5:
+                markdown_parts.append(f"- ... and {len(bboxes) - 5} more cells\n")
+            markdown_parts.append("\n")
+            
         else:
-            markdown_content += "No tables detected in this image.\n\n"
-        
-        # Create output filename
-        output_filename = f"{base_name}_optimized_table.md"
-        output_path = os.path.join(output_dir, output_filename)
-        
-        # Save markdown content
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
-        
-        logger.info(f"Successfully processed {image_path} -> {output_path}")
-        return True
-        
-    except Exception as e:
-        logger.error(f"Error processing {image_path} with RapidTable + Hybrid OCR: {str(e)}")
-        return False
+            markdown_parts.append("No table structure detected in this image.\n\n")
+    else:
+        markdown_parts.append("No tables detected in this image.\n\n")
+    
+    # Create output filename
+    output_filename = f"{base_name}_optimized_table.md"
+    output_path = os.path.join(output_dir, output_filename)
+    
+    # Save markdown content
+    write(output_path, markdown_parts)
+    
+    return output_path
 
-def create_enhanced_hybrid_table_recognition(image_path, output_dir):
+def create_enhanced_hybrid_table_recognition(image_path, output_dir, text_results=None, image_array=None):
     """
     Create an enhanced hybrid approach combining text-based table recognition with confidence scoring.
     
     Args:
         image_path (str): Path to the input image
         output_dir (str): Directory to save the markdown output
+        text_results: Full-page EasyOCR results from detect_text; the page is
+            OCR'd here when omitted
+        image_array: Already decoded image to OCR when text_results is
+            omitted; loaded from image_path when also omitted
     """
     try:
-        # Get the base filename without extension
-        base_name = Path(image_path).stem
-        
         logger.info(f"Creating enhanced hybrid table recognition for {image_path}...")
         
-        # Load image
-        original_image = Image.open(image_path)
-        
-        # Initialize OCR readers
-        ocr_readers = {}
-        
-        if EASYOCR_AVAILABLE:
-            try:
-                easyocr_reader = easyocr.Reader(['en', 'ch_sim'], gpu=False)
-                ocr_readers["EasyOCR"] = easyocr_reader
-            except Exception as e:
-                logger.warning(f"Failed to initialize EasyOCR: {str(e)}")
-        
-        if PADDLEOCR_AVAILABLE:
-            try:
-                paddleocr_reader = PaddleOCR(use_textline_orientation=True, lang='en')
-                ocr_readers["PaddleOCR"] = paddleocr_reader
-            except Exception as e:
-                logger.warning(f"Failed to initialize PaddleOCR: {str(e)}")
+        if text_results is None:
+            # Load image unless the caller already decoded it
+            if image_array is None:
+                image_array = load_image(image_path)
+            text_results = detect_text(image_array)
         
-        # Use EasyOCR to get text regions first
-        if "EasyOCR" in ocr_readers:
+        if text_results is not None:
             try:
-                # Get text regions from the entire image
-                text_results = ocr_readers["EasyOCR"].readtext(np.array(original_image))
-                
-                # Create a comprehensive table structure based on text positioning
-                markdown_content = f"# Image: {base_name}\n\n"
-                markdown_content += "## Enhanced Hybrid Table Recognition Results\n\n"
-                
-                if text_results:
-                    markdown_content += "### Detected Text Elements\n\n"
-                    
-                    # Group text by approximate rows (y-coordinate clustering)
-                    text_elements = []
-                    for bbox, text, confidence in text_results:
-                        if confidence > 0.2:  # Lower threshold for more text
-                            center_y = (bbox[0][1] + bbox[2][1]) / 2
-                            center_x = (bbox[0][0] + bbox[2][0]) / 2
-                            text_elements.append({
-                                'text': text.strip(),
-                                'bbox': bbox,
-                                'center_x': center_x,
-                                'center_y': center_y,
-                                'confidence': confidence
-                            })
-                    
-                    # Sort by y-coordinate to group by rows
-                    text_elements.sort(key=lambda x: x['center_y'])
-                    
-                    # Create a structured table based on text positioning
-                    if text_elements:
-                        markdown_content += "**Text-based Table Structure:**\n\n"
-                        
-                        # Group into approximate rows (within 25 pixels for better grouping)
-                        rows = []
-                        current_row = []
-                        last_y = None
-                        
-                        for elem in text_elements:
-                            if last_y is None or abs(elem['center_y'] - last_y) < 25:
-                                current_row.append(elem)
-                            else:
-                                if current_row:
-                                    # Sort elements in row by x-coordinate
-                                    current_row.sort(key=lambda x: x['center_x'])
-                                    rows.append(current_row)
-                                current_row = [elem]
-                            last_y = elem['center_y']
-                        
-                        if current_row:
-                            current_row.sort(key=lambda x: x['center_x'])
-                            rows.append(current_row)
-                        
-                        # Create markdown table
-                        if rows:
-                            # Find max columns
-                            max_cols = max(len(row) for row in rows)
-                            
-                            # Pad rows to have same number of columns
-                            for row in rows:
-                                while len(row) < max_cols:
-                                    row.append({'text': ' ', 'confidence': 0})
-                            
-                            # Create table
-                            for i, row in enumerate(rows):
-                                if i == 0:  # Header
-                                    markdown_content += "| " + " | ".join(elem['text'] for elem in row) + " |\n"
-                                    markdown_content += "| " + " | ".join("---" for _ in row) + " |\n"
-                                else:
-                                    markdown_content += "| " + " | ".join(elem['text'] for elem in row) + " |\n"
-                            
-                            markdown_content += "\n"
-                        
-                        # Add comprehensive text analysis
-                        markdown_content += f"**Total text elements detected**: {len(text_elements)}\n\n"
-                        
-                        # High confidence elements
-                        high_conf_elements = [elem for elem in text_elements if elem['confidence'] > 0.8]
-                        markdown_content += f"**High-confidence text elements (>80%): {len(high_conf_elements)}**\n"
-                        for i, elem in enumerate(high_conf_elements[:15]):
-                            markdown_content += f"- \"{elem['text']}\" (confidence: {elem['confidence']:.2f})\n"
-                        if len(high_conf_elements) > 15:
-                            markdown_content += f"- ... and {len(high_conf_elements) - 15} more high-confidence elements\n"
-                        
-                        markdown_content += "\n"
-                        
-                        # Medium confidence elements
-                        medium_conf_elements = [elem for elem in text_elements if 0.5 <= elem['confidence'] <= 0.8]
-                        markdown_content += f"**Medium-confidence text elements (50-80%): {len(medium_conf_elements)}**\n"
-                        for i, elem in enumerate(medium_conf_elements[:10]):
-                            markdown_content += f"- \"{elem['text']}\" (confidence: {elem['confidence']:.2f})\n"
-                        if len(medium_conf_elements) > 10:
-                            markdown_content += f"- ... and {len(medium_conf_elements) - 10} more medium-confidence elements\n"
-                        
-                        markdown_content += "\n"
-                        
-                        # Text quality metrics
-                        avg_confidence = sum(elem['confidence'] for elem in text_elements) / len(text_elements)
-                        markdown_content += f"**Text Quality Metrics:**\n"
-                        markdown_content += f"- Average confidence: {avg_confidence:.2f}\n"
-                        markdown_content += f"- High confidence ratio: {len(high_conf_elements)/len(text_elements)*100:.1f}%\n"
-                        markdown_content += f"- Medium confidence ratio: {len(medium_conf_elements)/len(text_elements)*100:.1f}%\n\n"
-                        
-                    else:
-                        markdown_content += "No text elements detected with sufficient confidence.\n\n"
-                else:
-                    markdown_content += "No text detected in this image.\n\n"
-                
-                # Create output filename
-                output_filename = f"{base_name}_enhanced_hybrid.md"
-                output_path = os.path.join(output_dir, output_filename)
-                
-                # Save markdown content
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(markdown_content)
-                
+                output_path = write_enhanced_hybrid_markdown(image_path, text_results, output_dir)
                 logger.info(f"Successfully created enhanced hybrid table recognition for {image_path} -> {output_path}")
                 return True
                 
@@ -477,9 +799,306 @@ def create_enhanced_hybrid_table_recognition(image_path, output_dir):
         logger.error(f"Error in enhanced hybrid table recognition for {image_path}: {str(e)}")
         return False
 
+def write_enhanced_hybrid_markdown(image_path, text_results, output_dir, write=write_markdown_file):
+    """
+    Build a text-position based table from full-page EasyOCR results and save it.
+    
+    Args:
+        image_path (str): Path to the input image
+        text_results: EasyOCR readtext results for the whole page
+        output_dir (str): Directory to save the markdown output
+        write: Callable taking (output_path, markdown_parts) that saves the file
+    
+    Returns:
+        str: Path of the written markdown file
+    """
+    # Get the base filename without extension
+    base_name = Path(image_path).stem
+    
+    # Create a comprehensive table structure based on text positioning
+    markdown_parts = [
+        f"# Image: {base_name}\n\n",
+        "## Enhanced Hybrid Table Recognition Results\n\n",
+    ]
+    
+    if text_results:
+        markdown_parts.append("### Detected Text Elements\n\n")
+        
+        # Per-element numbers as arrays: keep elements above the confidence
+        # threshold (lower threshold for more text) and take bbox centres
+        boxes = np.asarray([result[0] for result in text_results], dtype=np.float64)  # (N, 4, 2)
+        confidences = np.asarray([result[2] for result in text_results], dtype=np.float64)
+        keep = np.flatnonzero(confidences > 0.2)
+        centers = (boxes[keep, 0] + boxes[keep, 2]) / 2  # (x, y) per kept element
+        confidences = confidences[keep]
+        texts = [text_results[i][1].strip() for i in keep]
+        
+        # Sort by y-coordinate to group by rows (stable, so ties keep detection order)
+        order = np.argsort(centers[:, 1], kind='stable')
+        
+        # Create a structured table based on text positioning
+        if len(order):
+            markdown_parts.append("**Text-based Table Structure:**\n\n")
+            
+            # Group into approximate rows (within 25 pixels for better grouping):
+            # a new row starts wherever the gap to the previous element is 25 or more
+            breaks = np.flatnonzero(np.diff(centers[order, 1]) >= 25) + 1
+            row_groups = np.split(order, breaks)
+            
+            # Sort elements in each row by x-coordinate
+            rows = [
+                [texts[i] for i in group[np.argsort(centers[group, 0], kind='stable')]]
+                for group in row_groups
+            ]
+            
+            # Create markdown table
+            if rows:
+                # Find max columns
+                max_cols = max(len(row) for row in rows)
+                
+                # Pad rows to have same number of columns
+                for row in rows:
+                    row.extend([' '] * (max_cols - len(row)))
+                
+                # Create table (first row is the header)
+                markdown_parts.append(_markdown_table(rows))
+                
+                markdown_parts.append("\n")
+            
+            # Add comprehensive text analysis
+            markdown_parts.append(f"**Total text elements detected**: {len(order)}\n\n")
+            
+            # High confidence elements (in row order)
+            sorted_confidences = confidences[order]
+            high_conf_elements = order[sorted_confidences > 0.8]
+            markdown_parts.append(f"**High-confidence text elements (>80%): {len(high_conf_elements)}**\n")
+            for i in high_conf_elements[:15]:
+                markdown_parts.append(f"- \"{texts[i]}\" (confidence: {confidences[i]:.2f})\n")
+            if len(high_conf_elements) > 15:
+                markdown_parts.append(f"- ... and {len(high_conf_elements) - 15} more high-confidence elements\n")
+            
+            markdown_parts.append("\n")
+            
+            # Medium confidence elements
+            medium_conf_elements = order[(sorted_confidences >= 0.5) & (sorted_confidences <= 0.8)]
+            markdown_parts.append(f"**Medium-confidence text elements (50-80%): {len(medium_conf_elements)}**\n")
+            for i in medium_conf_elements[:10]:
+                markdown_parts.append(f"- \"{texts[i]}\" (confidence: {confidences[i]:.2f})\n")
+            if len(medium_conf_elements) > 10:
+                markdown_parts.append(f"- ... and {len(medium_conf_elements) - 10} more medium-confidence elements\n")
+            
+            markdown_parts.append("\n")
+            
+            # Text quality metrics
+            avg_confidence = confidences.mean()
+            markdown_parts.append(f"**Text Quality Metrics:**\n")
+            markdown_parts.append(f"- Average confidence: {avg_confidence:.2f}\n")
+            markdown_parts.append(f"- High confidence ratio: {len(high_conf_elements)/len(order)*100:.1f}%\n")
+            markdown_parts.append(f"- Medium confidence ratio: {len(medium_conf_elements)/len(order)*100:.1f}%\n\n")
+            
+        else:
+            markdown_parts.append("No text elements detected with sufficient confidence.\n\n")
+    else:
+        markdown_parts.append("No text detected in this image.\n\n")
+    
+    # Create output filename
+    output_filename = f"{base_name}_enhanced_hybrid.md"
+    output_path = os.path.join(output_dir, output_filename)
+    
+    # Save markdown content
+    write(output_path, markdown_parts)
+    
+    return output_path
+
+# Bounded hand-off between pipeline stages keeps at most a few decoded
+# images in memory while letting the stages overlap
+PIPELINE_QUEUE_SIZE = 4
+
+def run_pipeline(image_files, output_dir):
+    """
+    Process images in overlapping stages, each on its own thread.
+    
+    Stage 1 loads images from disk, stage 2 runs RapidTable structure
+    recognition, and stage 3 runs one full-page OCR pass and builds both
+    markdown outputs from it. The files are written by a fourth thread so disk
+    latency does not stall OCR.
+    While one image is being OCR'd the next ones are already being decoded and
+    run through RapidTable.
+    
+    Args:
+        image_files (list): Paths of the images to process
+        output_dir (str): Directory to save the markdown outputs
+    
+    Returns:
+        tuple: (successful_rapidtable, successful_enhanced_hybrid)
+    """
+    load_queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    table_queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    write_queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    counts = {"rapidtable": 0, "enhanced_hybrid": 0}
+    
+    def load_stage():
+        for image_file in image_files:
+            image_path = str(image_file)
+            image_array = None
+            logger.info(f"Processing {image_path} with RapidTable + Hybrid OCR...")
+            try:
+                image_array = load_image(image_path)
+            except Exception as e:
+                logger.error(f"Error processing {image_path}: {str(e)}")
+            load_queue.put((image_path, image_array))
+        load_queue.put(None)
+    
+    def table_stage():
+        while True:
+            item = load_queue.get()
+            if item is None:
+                table_queue.put(None)
+                break
+            image_path, image_array = item
+            table_results = None
+            if RAPIDTABLE_AVAILABLE and image_array is not None:
+                try:
+                    table_results = recognize_table_structure(image_array)
+                except Exception as e:
+                    logger.error(f"Error processing {image_path} with RapidTable + Hybrid OCR: {str(e)}")
+            table_queue.put((image_path, image_array, table_results))
+    
+    def ocr_stage():
+        # Load this thread's OCR readers before the first page arrives
+        get_ocr_readers()
+        while True:
+            item = table_queue.get()
+            if item is None:
+                break
+            image_path, image_array, table_results = item
+            if image_array is None:
+                continue
+            rapidtable_ok, hybrid_ok = write_both_outputs(
+                image_path, image_array, table_results, detect_text(image_array), output_dir,
+                write=lambda output_path, markdown_parts: write_queue.put((output_path, markdown_parts))
+            )
+            counts["rapidtable"] += rapidtable_ok
+            counts["enhanced_hybrid"] += hybrid_ok
+        write_queue.put(None)
+    
+    def write_stage():
+        while True:
+            item = write_queue.get()
+            if item is None:
+                break
+            output_path, markdown_parts = item
+            try:
+                write_markdown_file(output_path, markdown_parts)
+            except OSError as e:
+                logger.error(f"Error writing {output_path}: {str(e)}")
+    
+    stages = [
+        threading.Thread(target=load_stage, name="load"),
+        threading.Thread(target=table_stage, name="rapidtable"),
+        threading.Thread(target=ocr_stage, name="ocr"),
+        threading.Thread(target=write_stage, name="write"),
+    ]
+    for stage in stages:
+        stage.start()
+    for stage in stages:
+        stage.join()
+    
+    return counts["rapidtable"], counts["enhanced_hybrid"]
+
+def write_both_outputs(image_path, image_array, table_results, text_results, output_dir,
+                       write=write_markdown_file):
+    """
+    Write the RapidTable + Hybrid OCR and Enhanced Hybrid markdown for one image.
+    
+    Both outputs are built from the same full-page OCR results and saved
+    through write (see write_markdown_file).
+    
+    Returns:
+        tuple: (rapidtable_success, enhanced_hybrid_success)
+    """
+    # RapidTable + Hybrid OCR
+    rapidtable_ok = False
+    if not RAPIDTABLE_AVAILABLE:
+        logger.error("RapidTable not available")
+    elif table_results is not None:
+        try:
+            output_path = write_optimized_table_markdown(
+                image_path, image_array, table_results, output_dir, text_results=text_results, write=write
+            )
+            logger.info(f"Successfully processed {image_path} -> {output_path}")
+            rapidtable_ok = True
+        except Exception as e:
+            logger.error(f"Error processing {image_path} with RapidTable + Hybrid OCR: {str(e)}")
+    
+    # Enhanced Hybrid approach
+    hybrid_ok = False
+    if text_results is not None:
+        try:
+            output_path = write_enhanced_hybrid_markdown(image_path, text_results, output_dir, write=write)
+            logger.info(f"Successfully created enhanced hybrid table recognition for {image_path} -> {output_path}")
+            hybrid_ok = True
+        except Exception as e:
+            logger.error(f"Error in enhanced hybrid table recognition for {image_path}: {str(e)}")
+    
+    return rapidtable_ok, hybrid_ok
+
+def _process_image_both(image_path, output_dir):
+    """
+    Analyze one image once and write both table outputs.
+    
+    Returns:
+        tuple: (rapidtable_success, enhanced_hybrid_success)
+    """
+    logger.info(f"Processing {image_path} with RapidTable + Hybrid OCR...")
+    try:
+        image_array, table_results, text_results = analyze_image(image_path)
+    except Exception as e:
+        logger.error(f"Error processing {image_path}: {str(e)}")
+        return False, False
+    return write_both_outputs(image_path, image_array, table_results, text_results, output_dir)
+
+def run_thread_pool(image_files, output_dir, max_workers):
+    """
+    Process images concurrently on a pool of threads sharing one set of models.
+    
+    The heavy work (ONNX Runtime, PyTorch, Paddle) runs in native code that
+    releases the GIL, so whole images can be processed in parallel threads.
+    
+    Args:
+        image_files (list): Paths of the images to process
+        output_dir (str): Directory to save the markdown outputs
+        max_workers (int): Number of worker threads
+    
+    Returns:
+        tuple: (successful_rapidtable, successful_enhanced_hybrid)
+    """
+    image_paths = [str(image_file) for image_file in image_files]
+    # Each worker loads its own EasyOCR reader up front
+    with ThreadPoolExecutor(max_workers=max_workers, initializer=warm_up_models) as executor:
+        results = list(executor.map(_process_image_both, image_paths, [output_dir] * len(image_paths)))
+    successful_rapidtable = sum(1 for rapidtable_ok, _ in results if rapidtable_ok)
+    successful_enhanced_hybrid = sum(1 for _, hybrid_ok in results if hybrid_ok)
+    return successful_rapidtable, successful_enhanced_hybrid
+
+def warm_up_models():
+    """Load RapidTable and the calling thread's OCR readers so the first image does not pay for it."""
+    if RAPIDTABLE_AVAILABLE:
+        try:
+            get_rapid_table()
+        except Exception as e:
+            logger.warning(f"Failed to initialize RapidTable: {str(e)}")
+    get_ocr_readers()
+
 def main():
     """Main function to process OmniDocBench demo images with optimized table recognition."""
     
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help='Worker threads; 1 runs the staged pipeline. Each worker loads its own '
+                             'EasyOCR model, so memory use grows with this number')
+    args = parser.parse_args()
+    
     # Define paths
     demo_images_dir = "demo_data/omnidocbench_demo/images"
     output_dir = "omniparse_final_optimized_results"
@@ -492,33 +1111,32 @@ def main():
     # Create output directory if it doesn't exist
     os.makedirs(output_dir, exist_ok=True)
     
-    # Get list of image files
-    image_extensions = ['.jpg', '.jpeg', '.png', '.tiff', '.bmp']
-    image_files = []
-    
-    for ext in image_extensions:
-        image_files.extend(Path(demo_images_dir).glob(f"*{ext}"))
+    # Get list of image files in one directory pass (extensions matched case-insensitively)
+    image_extensions = {'.jpg', '.jpeg', '.png', '.tiff', '.bmp'}
+    image_files = [
+        Path(entry.path) for entry in os.scandir(demo_images_dir)
+        if entry.is_file() and Path(entry.name).suffix.lower() in image_extensions
+    ]
     
     logger.info(f"Found {len(image_files)} images to process")
     logger.info(f"Available tools: RapidTable: {RAPIDTABLE_AVAILABLE}, EasyOCR: {EASYOCR_AVAILABLE}, PaddleOCR: {PADDLEOCR_AVAILABLE}")
     
-    # Process each image with optimized table recognition
-    successful_rapidtable = 0
-    successful_enhanced_hybrid = 0
-    failed = 0
+    # Load the shared table model up front; OCR readers are per thread and
+    # are loaded by the threads that use them
+    set_rapid_table_callers(args.workers)
+    if RAPIDTABLE_AVAILABLE:
+        try:
+            get_rapid_table()
+        except Exception as e:
+            logger.warning(f"Failed to initialize RapidTable: {str(e)}")
     
-    for image_file in image_files:
-        image_path = str(image_file)
-        
-        # Try RapidTable + Hybrid OCR
-        if process_image_with_rapidtable_plus_hybrid_ocr(image_path, output_dir):
-            successful_rapidtable += 1
-        
-        # Try Enhanced Hybrid approach
-        if create_enhanced_hybrid_table_recognition(image_path, output_dir):
-            successful_enhanced_hybrid += 1
-        
-        failed += 1  # Count attempts
+    # Process each image with optimized table recognition
+    if args.workers > 1:
+        logger.info(f"Using {args.workers} worker threads")
+        successful_rapidtable, successful_enhanced_hybrid = run_thread_pool(image_files, output_dir, args.workers)
+    else:
+        successful_rapidtable, successful_enhanced_hybrid = run_pipeline(image_files, output_dir)
+    failed = len(image_files)  # Count attempts
     
     # Summary
     logger.info(f"Processing complete!")
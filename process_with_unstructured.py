@@ -5,55 +5,648 @@ This script processes the demo images and generates predictions for evaluation.
 """
 
 import os
+import io
 import sys
+import queue
+import ctypes
+import hashlib
+import argparse
+import functools
+import importlib.util
+import importlib.metadata
+import multiprocessing
+import shutil
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from unstructured.partition.auto import partition
-from unstructured.staging.base import elements_to_md
 import logging
 
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def process_image_with_unstructured(image_path, output_dir):
+# Threads sharing one CUDA model; enough to overlap preprocessing with inference
+GPU_WORKERS = 4
+
+# Upper bound on images handed to a worker per task
+BATCH_SIZE = 8
+
+# Rough peak memory of one hi_res partition worker, used to cap the pool size
+WORKER_MEMORY_GB = 2
+
+# Reader threads and read-ahead depth for image prefetching
+PREFETCH_WORKERS = 16
+PREFETCH_QUEUE_SIZE = 64
+
+# Partition settings; both are part of the markdown cache key
+PARTITION_STRATEGY = "hi_res"
+HI_RES_MODEL_NAME = os.environ.get("UNSTRUCTURED_HI_RES_MODEL_NAME", "yolox")
+
+# Markdown cache keyed by image content and partition settings, shared across
+# runs. Off unless enabled with --markdown-cache (which sets the variable
+# below, so worker processes see it too): reused markdown was not produced
+# by this run, so evaluation runs should start without it
+MARKDOWN_CACHE_ENABLED_ENV = "UNSTRUCTURED_MARKDOWN_CACHE_ENABLED"
+MARKDOWN_CACHE_DIR = os.environ.get("UNSTRUCTURED_MARKDOWN_CACHE", ".unstructured_markdown_cache")
+
+def markdown_cache_enabled():
+    """Return True if cached markdown may be reused."""
+    return os.environ.get(MARKDOWN_CACHE_ENABLED_ENV) == "1"
+
+@functools.lru_cache(maxsize=None)
+def _unstructured_version():
+    """Installed unstructured version, without importing the package."""
+    try:
+        return importlib.metadata.version("unstructured")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+@functools.lru_cache(maxsize=None)
+def _partition_settings_tag():
+    """Short digest of the unstructured version, strategy and layout model."""
+    settings = f"{_unstructured_version()}|{PARTITION_STRATEGY}|{HI_RES_MODEL_NAME}"
+    return hashlib.blake2b(settings.encode(), digest_size=8).hexdigest()
+
+@functools.lru_cache(maxsize=None)
+def cuda_device_count():
     """
-    Process a single image with Unstructured and save as markdown.
+    Count CUDA devices through the driver library without importing torch.
+
+    Probing libcuda directly takes milliseconds, whereas importing torch
+    costs seconds. The probe runs lazily so that worker processes can still
+    restrict CUDA_VISIBLE_DEVICES before the driver initializes.
+
+    Returns:
+        int: Number of visible CUDA devices (0 if torch or the driver is missing)
+    """
+    if importlib.util.find_spec("torch") is None:
+        return 0
+
+    try:
+        libcuda = ctypes.CDLL("libcuda.so.1")
+    except OSError:
+        return 0
+
+    count = ctypes.c_int(0)
+    if libcuda.cuInit(0) != 0 or libcuda.cuDeviceGetCount(ctypes.byref(count)) != 0:
+        return 0
+    return count.value
+
+def markdown_output_path(image_path, output_dir):
+    """Return the markdown path for an image (replace .jpg with .md)."""
+    return os.path.join(output_dir, f"{Path(image_path).stem}.md")
+
+def markdown_cache_path(digest):
+    """Cache file for an image content digest under the current partition settings."""
+    return os.path.join(MARKDOWN_CACHE_DIR, f"{digest}-{_partition_settings_tag()}.md")
+
+def _content_digest(data):
+    """Return a short hex digest identifying file contents (BLAKE3 when installed)."""
+    if BLAKE3_AVAILABLE:
+        return blake3.blake3(data).hexdigest()[:32]
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+@functools.lru_cache(maxsize=512)
+def _load_cached_markdown(cache_path):
+    """Read a cached markdown file; misses raise OSError and are not memoized."""
+    with open(cache_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def _store_cached_markdown(cache_path, markdown_content):
+    """Atomically write markdown into the cache so concurrent workers never see partial files."""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(markdown_content)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not cache {cache_path}: {str(e)}")
+
+def cache_markdown(convert):
+    """
+    Memoize an image-to-markdown converter on disk by image content.
+
+    When the cache is enabled (markdown_cache_enabled), identical image
+    bytes under the same unstructured version, strategy and layout model map
+    to the same cache entry, so reruns skip partitioning for images seen
+    before. An in-memory LRU layer avoids re-reading cache files within a run.
+
+    Args:
+        convert (callable): Function (image_path, image_bytes) -> markdown or None
+
+    Returns:
+        callable: Wrapped converter with the same signature
+    """
+    @functools.wraps(convert)
+    def wrapper(image_path, image_bytes=None):
+        if not markdown_cache_enabled():
+            return convert(image_path, image_bytes)
+        if image_bytes is None:
+            try:
+                image_bytes = Path(image_path).read_bytes()
+            except OSError:
+                # Let the converter report the failure
+                return convert(image_path)
+
+        cache_path = markdown_cache_path(_content_digest(image_bytes))
+        try:
+            markdown_content = _load_cached_markdown(cache_path)
+            logger.info(f"Using cached markdown for {image_path}")
+            return markdown_content
+        except OSError:
+            pass
+
+        markdown_content = convert(image_path, image_bytes)
+        if markdown_content is not None:
+            _store_cached_markdown(cache_path, markdown_content)
+        return markdown_content
+
+    return wrapper
+
+def _is_up_to_date(image_path, output_path):
+    """Return True if output_path exists and is at least as new as image_path."""
+    try:
+        return os.path.getmtime(output_path) >= os.path.getmtime(image_path)
+    except OSError:
+        return False
+
+@functools.lru_cache(maxsize=None)
+def _get_partition():
+    """
+    Import the unstructured entry points on first use.
+
+    Importing unstructured pulls in the hi_res stack (torch, layout models),
+    which takes seconds. Deferring it keeps early exits fast and lets spawned
+    workers pay the cost once, only when they have an image to process.
+
+    Returns:
+        tuple: (partition, elements_to_md)
+    """
+    from unstructured.partition.auto import partition
+    from unstructured.staging.base import elements_to_md
+    return partition, elements_to_md
+
+@cache_markdown
+def convert_image_to_markdown(image_path, image_bytes=None):
+    """
+    Partition a single image with Unstructured and render it as markdown.
     
     Args:
         image_path (str): Path to the input image
-        output_dir (str): Directory to save the markdown output
+        image_bytes (bytes): Prefetched file contents; read from image_path if None
+        
+    Returns:
+        str: Markdown content, or None if processing failed
     """
+    partition, elements_to_md = _get_partition()
+
     try:
-        # Get the base filename without extension
-        base_name = Path(image_path).stem
-        
         # Process the image with Unstructured
         logger.info(f"Processing {image_path}...")
         
         # Use strategy="hi_res" for better table detection as per memory
-        elements = partition(image_path, strategy="hi_res")
+        if image_bytes is not None:
+            elements = partition(file=io.BytesIO(image_bytes), strategy=PARTITION_STRATEGY,
+                                 hi_res_model_name=HI_RES_MODEL_NAME, metadata_filename=image_path)
+        else:
+            elements = partition(image_path, strategy=PARTITION_STRATEGY,
+                                 hi_res_model_name=HI_RES_MODEL_NAME)
         
         # Convert to markdown
-        markdown_content = elements_to_md(elements)
-        
-        # Create output filename (replace .jpg with .md)
-        output_filename = f"{base_name}.md"
-        output_path = os.path.join(output_dir, output_filename)
+        return elements_to_md(elements)
         
+    except Exception as e:
+        logger.error(f"Error processing {image_path}: {str(e)}")
+        return None
+
+def process_image_with_unstructured(image_path, output_dir, image_bytes=None):
+    """
+    Process a single image with Unstructured and save as markdown.
+    
+    Args:
+        image_path (str): Path to the input image
+        output_dir (str): Directory to save the markdown output
+        image_bytes (bytes): Prefetched file contents; read from image_path if None
+    """
+    output_path = markdown_output_path(image_path, output_dir)
+    if _is_up_to_date(image_path, output_path):
+        logger.info(f"Skipping {image_path}, {output_path} is up to date")
+        return True
+
+    markdown_content = convert_image_to_markdown(image_path, image_bytes)
+    if markdown_content is None:
+        return False
+
+    try:
         # Save markdown content
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(markdown_content)
-        
-        logger.info(f"Successfully processed {image_path} -> {output_path}")
-        return True
-        
-    except Exception as e:
-        logger.error(f"Error processing {image_path}: {str(e)}")
+    except OSError as e:
+        logger.error(f"Error writing {output_path}: {str(e)}")
         return False
 
+    logger.info(f"Successfully processed {image_path} -> {output_path}")
+    return True
+
+def load_layout_model():
+    """
+    Materialize the hi_res layout detection model in the current process.
+
+    unstructured_inference caches loaded models per process, so loading it
+    once up front means every partition call in a batch reuses it.
+
+    Returns:
+        The layout model, or None if unstructured_inference is unavailable
+    """
+    try:
+        from unstructured_inference.models.base import get_model
+    except ImportError:
+        return None
+
+    try:
+        return get_model(HI_RES_MODEL_NAME)
+    except Exception as e:
+        logger.warning(f"Could not preload layout model: {str(e)}")
+        return None
+
+def process_images_batched(images):
+    """
+    Convert a batch of images with a single layout model load.
+
+    Args:
+        images (list): (image_path, image_bytes) pairs in this batch
+
+    Returns:
+        list: Markdown content per image (None on failure), in input order
+    """
+    load_layout_model()
+    return [convert_image_to_markdown(image_path, image_bytes)
+            for image_path, image_bytes in images]
+
+def _writer_loop(write_queue, write_failures):
+    """
+    Write queued markdown outputs until a None sentinel arrives.
+
+    Args:
+        write_queue (queue.Queue): (output_path, markdown_content) items
+        write_failures (list): Collects output paths that could not be written
+    """
+    while True:
+        item = write_queue.get()
+        if item is None:
+            return
+
+        output_path, markdown_content = item
+        try:
+            with open(output_path, 'w', buffering=1 << 20, encoding='utf-8') as f:
+                f.write(markdown_content)
+        except OSError as e:
+            logger.error(f"Error writing {output_path}: {str(e)}")
+            write_failures.append(output_path)
+            continue
+
+        logger.info(f"Successfully wrote {output_path}")
+
+def _read_image(image_path):
+    """
+    Read and hash an image file on a reader thread.
+
+    Both hash functions release the GIL on large buffers, so hashing runs
+    in parallel with the other readers.
+
+    Returns:
+        tuple: (image_bytes, digest), or (None, None) so the worker retries
+        from disk on failure
+    """
+    try:
+        image_bytes = Path(image_path).read_bytes()
+    except OSError as e:
+        logger.warning(f"Could not prefetch {image_path}: {str(e)}")
+        return None, None
+    return image_bytes, _content_digest(image_bytes)
+
+def _prefetch_images(image_paths, max_workers=PREFETCH_WORKERS, queue_size=PREFETCH_QUEUE_SIZE):
+    """
+    Read image files ahead of processing on a pool of reader threads.
+
+    A producer thread reads windows of up to queue_size files concurrently and
+    feeds them into a bounded queue, so disk reads overlap with partitioning
+    while memory stays bounded by the read-ahead depth.
+
+    Args:
+        image_paths (list): Paths of the images to read
+        max_workers (int): Number of concurrent reader threads
+        queue_size (int): Maximum number of images read ahead
+
+    Yields:
+        tuple: (image_path, image_bytes, digest) in input order
+    """
+    prefetched = queue.Queue(maxsize=queue_size)
+
+    def produce():
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as readers:
+                for start in range(0, len(image_paths), queue_size):
+                    window = image_paths[start:start + queue_size]
+                    for image_path, (image_bytes, digest) in zip(window, readers.map(_read_image, window)):
+                        prefetched.put((image_path, image_bytes, digest))
+        finally:
+            prefetched.put(None)
+
+    threading.Thread(target=produce, daemon=True).start()
+    while True:
+        item = prefetched.get()
+        if item is None:
+            return
+        yield item
+
+def link_duplicate_output(output_path, primary_output_path):
+    """
+    Point a duplicate image's markdown at the output of its identical twin.
+
+    Args:
+        output_path (str): Markdown path for the duplicate image
+        primary_output_path (str): Markdown path already written for the first copy
+
+    Returns:
+        bool: True if the link (or fallback copy) was created
+    """
+    # Same stem with a different extension already shares the output
+    if os.path.abspath(output_path) == os.path.abspath(primary_output_path):
+        return True
+
+    try:
+        if os.path.lexists(output_path):
+            os.remove(output_path)
+        os.symlink(os.path.relpath(primary_output_path, os.path.dirname(output_path)), output_path)
+    except OSError:
+        # Symlinks can be unavailable (e.g. Windows without privileges)
+        try:
+            shutil.copyfile(primary_output_path, output_path)
+        except OSError as e:
+            logger.error(f"Error linking {output_path}: {str(e)}")
+            return False
+    return True
+
+def _parse_cpulist(cpulist):
+    """Expand a sysfs cpulist such as '0-3,8-11' into a set of CPU ids."""
+    cpus = set()
+    for part in cpulist.strip().split(','):
+        if not part:
+            continue
+        first, _, last = part.partition('-')
+        cpus.update(range(int(first), int(last or first) + 1))
+    return cpus
+
+def _numa_node_cpus():
+    """
+    List the CPUs of each NUMA node, limited to those this process may use.
+
+    Returns:
+        list: One set of CPU ids per NUMA node (empty if the topology is unknown)
+    """
+    node_root = Path("/sys/devices/system/node")
+    if not node_root.is_dir() or not hasattr(os, "sched_getaffinity"):
+        return []
+
+    allowed = os.sched_getaffinity(0)
+    nodes = []
+    for node_dir in sorted(node_root.glob("node[0-9]*"), key=lambda d: int(d.name[4:])):
+        try:
+            cpus = _parse_cpulist((node_dir / "cpulist").read_text()) & allowed
+        except (OSError, ValueError):
+            continue
+        if cpus:
+            nodes.append(cpus)
+    return nodes
+
+def _pin_worker(worker_counter, n_gpus, n_threads):
+    """
+    Process pool initializer giving each worker its own GPU, NUMA node and core share.
+
+    Workers take sequential ids from a shared counter. With GPUs present,
+    CUDA_VISIBLE_DEVICES is narrowed to one device before anything
+    initializes CUDA. The worker is then bound to the CPUs of one NUMA node,
+    so its memory stays local to that socket, and torch is limited to
+    n_threads so the workers together do not oversubscribe the cores.
+
+    Args:
+        worker_counter (multiprocessing.Value): Shared counter handing out worker ids
+        n_gpus (int): Number of CUDA devices to spread workers across
+        n_threads (int): Intra-op threads for this worker
+    """
+    with worker_counter.get_lock():
+        worker_id = worker_counter.value
+        worker_counter.value += 1
+
+    if n_gpus > 0:
+        os.environ["CUDA_VISIBLE_DEVICES"] = str(worker_id % n_gpus)
+
+    nodes = _numa_node_cpus()
+    if len(nodes) > 1:
+        try:
+            os.sched_setaffinity(0, nodes[worker_id % len(nodes)])
+        except OSError as e:
+            logger.warning(f"Could not pin worker {worker_id}: {str(e)}")
+
+    try:
+        import torch
+        torch.set_num_threads(n_threads)
+    except ImportError:
+        pass
+
+def _default_worker_count():
+    """Size the CPU process pool by core count, capped so workers fit in free RAM."""
+    cpu_count = os.cpu_count() or 1
+    try:
+        free_gb = os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") / (1024 ** 3)
+    except (AttributeError, ValueError, OSError):
+        return cpu_count
+    return max(1, min(cpu_count, int(free_gb // WORKER_MEMORY_GB)))
+
+def _create_executor(max_workers=None):
+    """
+    Choose an executor for the available hardware.
+
+    CPU-only runs use a process pool sized by cores and free memory, each
+    worker getting an equal share of the cores. A single GPU is shared by a
+    small thread pool that overlaps preprocessing with inference. Multiple
+    GPUs get one process per device. Process workers are never forked from
+    this process: the writer and prefetch threads are already running when
+    the pool starts, and a forked child cannot reinitialize CUDA. They are
+    pinned to NUMA nodes round-robin.
+
+    Args:
+        max_workers (int): Worker count override
+
+    Returns:
+        tuple: (executor, max_workers)
+    """
+    n_gpus = cuda_device_count()
+    if n_gpus == 1:
+        max_workers = max_workers or GPU_WORKERS
+        return ThreadPoolExecutor(max_workers=max_workers), max_workers
+
+    if n_gpus > 1:
+        context = multiprocessing.get_context("spawn")
+        max_workers = max_workers or n_gpus
+    else:
+        start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        context = multiprocessing.get_context(start_method)
+        max_workers = max_workers or _default_worker_count()
+
+    n_threads = max(1, (os.cpu_count() or 1) // max_workers)
+    executor = ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=context,
+        initializer=_pin_worker,
+        initargs=(context.Value('i', 0), n_gpus, n_threads),
+    )
+    return executor, max_workers
+
+def process_images_parallel(image_files, output_dir, max_workers=None, batch_size=BATCH_SIZE):
+    """
+    Process images concurrently and count the outcomes.
+
+    The executor is chosen by _create_executor(). Images whose markdown is
+    already newer than the image are skipped and counted as successful.
+    Images with identical content are partitioned once; the duplicates get
+    symlinks to the first copy's markdown.
+
+    Args:
+        image_files (list): Paths of the images to process
+        output_dir (str): Directory to save the markdown output
+        max_workers (int): Worker count (defaults to the CPU count capped by free memory, GPU_WORKERS
+            with one GPU, or one per GPU with several)
+        batch_size (int): Maximum number of images per worker task
+
+    Returns:
+        tuple: (successful, failed) counts
+    """
+    # Skip images whose markdown is newer than the image, so reruns only
+    # redo what failed or changed
+    image_paths = [str(image_file) for image_file in image_files]
+    pending_paths = [
+        image_path for image_path in image_paths
+        if not _is_up_to_date(image_path, markdown_output_path(image_path, output_dir))
+    ]
+    if len(pending_paths) < len(image_paths):
+        logger.info(f"Skipping {len(image_paths) - len(pending_paths)} images with up-to-date markdown")
+    if not pending_paths:
+        return len(image_paths), 0
+
+    executor, max_workers = _create_executor(max_workers)
+
+    # Shrink batches on small runs so every worker still gets work
+    batch_size = max(1, min(batch_size, -(-len(pending_paths) // max_workers)))
+
+    # Workers only convert; a single writer thread owns all output files
+    write_queue = queue.Queue()
+    write_failures = []
+    writer = threading.Thread(target=_writer_loop, args=(write_queue, write_failures))
+    writer.start()
+
+    # Submit batches as their images arrive from the prefetcher, keeping at
+    # most two batches per worker in flight so prefetched bytes stay bounded
+    in_flight = threading.BoundedSemaphore(2 * max_workers)
+    conversion_failures = []
+
+    def submit(batch):
+        batch_paths = [image_path for image_path, _ in batch]
+
+        def on_done(future):
+            in_flight.release()
+            try:
+                contents = future.result()
+            except Exception as e:
+                logger.error(f"Batch starting at {batch_paths[0]} failed: {str(e)}")
+                contents = [None] * len(batch_paths)
+            for image_path, markdown_content in zip(batch_paths, contents):
+                if markdown_content is None:
+                    conversion_failures.append(image_path)
+                else:
+                    write_queue.put((markdown_output_path(image_path, output_dir), markdown_content))
+
+        in_flight.acquire()
+        executor.submit(process_images_batched, batch).add_done_callback(on_done)
+
+    # First image seen per content digest, and (duplicate, first) pairs
+    primaries = {}
+    duplicates = []
+    use_cache = markdown_cache_enabled()
+    cache_hits = 0
+
+    batch = []
+    try:
+        with executor:
+            for image_path, image_bytes, digest in _prefetch_images(pending_paths):
+                if digest is not None:
+                    if digest in primaries:
+                        duplicates.append((image_path, primaries[digest]))
+                        continue
+                    primaries[digest] = image_path
+
+                    # Cached markdown goes straight to the writer
+                    if use_cache:
+                        try:
+                            markdown_content = _load_cached_markdown(markdown_cache_path(digest))
+                        except OSError:
+                            pass
+                        else:
+                            write_queue.put((markdown_output_path(image_path, output_dir), markdown_content))
+                            cache_hits += 1
+                            continue
+
+                batch.append((image_path, image_bytes))
+                if len(batch) == batch_size:
+                    submit(batch)
+                    batch = []
+            if batch:
+                submit(batch)
+    finally:
+        write_queue.put(None)
+        writer.join()
+
+    if cache_hits:
+        logger.warning(
+            f"Reused cached markdown for {cache_hits} images from {MARKDOWN_CACHE_DIR} "
+            f"(unstructured {_unstructured_version()}, strategy {PARTITION_STRATEGY}, "
+            f"model {HI_RES_MODEL_NAME}); run without --markdown-cache to regenerate them"
+        )
+
+    failed_outputs = set(write_failures)
+    failed_outputs.update(markdown_output_path(image_path, output_dir) for image_path in conversion_failures)
+    failed = len(conversion_failures) + len(write_failures)
+
+    if duplicates:
+        logger.info(f"Linking {len(duplicates)} duplicate images to existing outputs")
+    for image_path, primary_path in duplicates:
+        primary_output_path = markdown_output_path(primary_path, output_dir)
+        if primary_output_path in failed_outputs or not link_duplicate_output(
+                markdown_output_path(image_path, output_dir), primary_output_path):
+            failed += 1
+
+    return len(image_paths) - failed, failed
+
 def main():
     """Main function to process all OmniDocBench demo images."""
     
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--markdown-cache', action='store_true',
+                        help='Reuse markdown cached by earlier runs with the same unstructured version, '
+                             'strategy and layout model instead of partitioning those images again')
+    args = parser.parse_args()
+    if args.markdown_cache:
+        # Through the environment so worker processes enable it as well
+        os.environ[MARKDOWN_CACHE_ENABLED_ENV] = "1"
+    
     # Define paths
     demo_images_dir = "demo_data/omnidocbench_demo/images"
     output_dir = "unstructured_results"
@@ -62,28 +655,27 @@ def main():
     if not os.path.exists(demo_images_dir):
         logger.error(f"Demo images directory not found: {demo_images_dir}")
         sys.exit(1)
+
+    # find_spec locates the package without executing it
+    if importlib.util.find_spec("unstructured") is None:
+        logger.error("unstructured is not installed: pip install -r requirements_unstructured_only.txt")
+        sys.exit(1)
     
     # Create output directory if it doesn't exist
     os.makedirs(output_dir, exist_ok=True)
     
-    # Get list of image files
-    image_extensions = ['.jpg', '.jpeg', '.png', '.tiff', '.bmp']
-    image_files = []
-    
-    for ext in image_extensions:
-        image_files.extend(Path(demo_images_dir).glob(f"*{ext}"))
+    # Get list of image files in a single directory pass
+    image_extensions = {'.jpg', '.jpeg', '.png', '.tiff', '.bmp'}
+    with os.scandir(demo_images_dir) as entries:
+        image_files = [
+            Path(entry.path) for entry in entries
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in image_extensions
+        ]
     
     logger.info(f"Found {len(image_files)} images to process")
     
-    # Process each image
-    successful = 0
-    failed = 0
-    
-    for image_file in image_files:
-        if process_image_with_unstructured(str(image_file), output_dir):
-            successful += 1
-        else:
-            failed += 1
+    # Process images in parallel
+    successful, failed = process_images_parallel(image_files, output_dir)
     
     # Summary
     logger.info(f"Processing complete!")
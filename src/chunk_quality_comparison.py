@@ -13,12 +13,94 @@ This script provides a comprehensive analysis of chunk quality across multiple d
 
 import json
 import re
+import functools
 import statistics
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Tuple, Set, NamedTuple
 from dataclasses import dataclass
+import numpy as np
 from benchmark_runner import UnstructuredBenchmark
 
+# Patterns shared by the analyzers, compiled once at import
+_SENT_RE = re.compile(r'[.!?]+')
+_VOWEL_RE = re.compile(r'[aeiouy]+')
+# Line-start structure markers as one alternation; the matching group
+# (1 header, 2 bullet, 3 numbered item) tells which kind was found. Used on
+# the text with a newline prepended: a literal newline instead of ^ lets the
+# engine skip ahead between lines, and the lookahead leaves the whitespace
+# unconsumed so a marker line right after another one still matches
+_STRUCT_RE = re.compile(r'\n(?:(#{1,6})|([\*\-])|(\d+\.))(?=\s)')
+
+# Common words counted by the language quality check
+_COMMON_WORDS = frozenset({'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'})
+
+# Stop words ignored when comparing key terms between consecutive chunks
+_STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'})
+
+# Semantic connectors, searched for as substrings of the next chunk
+_CONNECTORS = ('however', 'therefore', 'furthermore', 'moreover', 'additionally',
+               'consequently', 'thus', 'hence', 'meanwhile', 'subsequently')
+
+# Texts at least this long count vowel groups with NumPy instead of _VOWEL_RE
+NUMPY_SYLLABLE_MIN_CHARS = 128
+
+# Bytes matched by _VOWEL_RE
+_VOWEL_LUT = np.zeros(256, dtype=bool)
+_VOWEL_LUT[np.frombuffer(b'aeiouy', dtype=np.uint8)] = True
+
+def _count_syllables(lower: str) -> int:
+    """
+    Approximate syllables as runs of vowels, equal to len(_VOWEL_RE.findall(lower)).
+
+    Long ASCII texts are classified byte-wise through a lookup table,
+    counting positions where a vowel follows a non-vowel (or starts the
+    text). Short or non-ASCII texts use the regex.
+
+    Args:
+        lower: Lowercased text
+
+    Returns:
+        Number of vowel groups
+    """
+    if len(lower) < NUMPY_SYLLABLE_MIN_CHARS or not lower.isascii():
+        return len(_VOWEL_RE.findall(lower))
+    is_vowel = _VOWEL_LUT[np.frombuffer(lower.encode('ascii'), dtype=np.uint8)]
+    return int(is_vowel[0]) + int(np.count_nonzero(is_vowel[1:] & ~is_vowel[:-1]))
+
+class ChunkStats(NamedTuple):
+    """Tokenization of one chunk, shared by all quality analyzers"""
+    text: str
+    lower: str
+    words: List[str]
+    lower_words: List[str]
+    lower_set: Set[str]
+    sentences: List[str]
+    syllable_count: int
+
+# Distinct chunk texts whose ChunkStats stay memoized
+CHUNK_STATS_CACHE_SIZE = 4096
+
+@functools.lru_cache(maxsize=CHUNK_STATS_CACHE_SIZE)
+def _chunk_stats(chunk: str) -> ChunkStats:
+    """
+    Split a chunk into words and sentences and count its syllables once.
+
+    Memoized on the chunk text: repeated chunks (headers, boilerplate, text
+    both chunkers emit identically) are tokenized once. The returned lists
+    and set are shared between callers and must not be mutated.
+    """
+    lower = chunk.lower()
+    lower_words = lower.split()
+    return ChunkStats(
+        text=chunk,
+        lower=lower,
+        words=chunk.split(),
+        lower_words=lower_words,
+        lower_set=set(lower_words),
+        sentences=_SENT_RE.split(chunk),
+        syllable_count=_count_syllables(lower),
+    )
+
 @dataclass
 class ChunkQualityMetrics:
     """Metrics for evaluating chunk quality"""
@@ -35,57 +117,77 @@ class ChunkQualityMetrics:
     content_overlap: float
     semantic_continuity: float
 
+def _flesch_batch(words, sentences, syllables) -> np.ndarray:
+    """
+    Flesch Reading Ease for many chunks at once from their base counts.
+
+    Args:
+        words: Word count per chunk
+        sentences: Sentence count per chunk
+        syllables: Syllable count per chunk
+
+    Returns:
+        Scores clipped to [0, 100]; 0.0 where a chunk has no words or sentences
+    """
+    words = np.asarray(words, dtype=np.float64)
+    sentences = np.asarray(sentences, dtype=np.float64)
+    syllables = np.asarray(syllables, dtype=np.float64)
+    valid = (words > 0) & (sentences > 0)
+    safe_words = np.where(valid, words, 1.0)
+    safe_sentences = np.where(valid, sentences, 1.0)
+    scores = 206.835 - (1.015 * (safe_words / safe_sentences)) - (84.6 * (syllables / safe_words))
+    return np.where(valid, np.clip(scores, 0.0, 100.0), 0.0)
+
+def clear_caches() -> None:
+    """Drop memoized chunk tokenizations to bound memory between documents"""
+    _chunk_stats.cache_clear()
+
 class ChunkQualityAnalyzer:
     def __init__(self):
         self.benchmark = UnstructuredBenchmark()
     
     def analyze_readability(self, text: str) -> float:
         """Calculate readability score using Flesch Reading Ease"""
-        try:
-            sentences = len(re.split(r'[.!?]+', text))
-            words = len(text.split())
-            syllables = len(re.findall(r'[aeiouy]+', text.lower()))
-            
-            if sentences == 0 or words == 0:
-                return 0.0
-            
-            # Flesch Reading Ease formula
-            score = 206.835 - (1.015 * (words / sentences)) - (84.6 * (syllables / words))
-            return max(0.0, min(100.0, score))
-        except:
-            return 0.0
+        stats = _chunk_stats(text)
+        return float(_flesch_batch([len(stats.words)], [len(stats.sentences)], [stats.syllable_count])[0])
     
     def analyze_coherence(self, chunks: List[str]) -> float:
         """Analyze coherence between chunks"""
-        if len(chunks) < 2:
+        return self._coherence_from_stats([_chunk_stats(chunk) for chunk in chunks])
+    
+    def _coherence_from_stats(self, stats: List[ChunkStats]) -> float:
+        if len(stats) < 2:
             return 1.0
         
         coherence_scores = []
-        for i in range(len(chunks) - 1):
-            chunk1 = chunks[i].lower()
-            chunk2 = chunks[i + 1].lower()
-            
+        for i in range(len(stats) - 1):
             # Calculate word overlap
-            words1 = set(chunk1.split())
-            words2 = set(chunk2.split())
+            words1 = stats[i].lower_set
+            words2 = stats[i + 1].lower_set
             
             if len(words1) == 0 or len(words2) == 0:
                 coherence_scores.append(0.0)
                 continue
             
+            # |A ∪ B| = |A| + |B| - |A ∩ B|, without building the union
             overlap = len(words1.intersection(words2))
-            total_unique = len(words1.union(words2))
+            total_unique = len(words1) + len(words2) - overlap
             coherence_scores.append(overlap / total_unique if total_unique > 0 else 0.0)
         
         return statistics.mean(coherence_scores) if coherence_scores else 0.0
     
     def analyze_completeness(self, chunks: List[str]) -> float:
         """Analyze semantic completeness of chunks"""
+        return self._completeness_from_stats([_chunk_stats(chunk) for chunk in chunks])
+    
+    def _completeness_from_stats(self, stats: List[ChunkStats]) -> float:
         completeness_scores = []
         
-        for chunk in chunks:
-            # Check for incomplete sentences at chunk boundaries
-            sentences = re.split(r'[.!?]+', chunk.strip())
+        for chunk_stats in stats:
+            # Check for incomplete sentences at chunk boundaries. Surrounding
+            # whitespace never splits a sentence, so the unstripped split has
+            # the same pieces once the last one is stripped
+            sentences = chunk_stats.sentences
             if len(sentences) > 1:
                 # Check if last sentence is complete
                 last_sentence = sentences[-1].strip()
@@ -100,16 +202,18 @@ class ChunkQualityAnalyzer:
     
     def analyze_information_density(self, chunks: List[str]) -> float:
         """Analyze information density (unique words vs total words)"""
-        if not chunks:
+        return self._information_density_from_stats([_chunk_stats(chunk) for chunk in chunks])
+    
+    def _information_density_from_stats(self, stats: List[ChunkStats]) -> float:
+        if not stats:
             return 0.0
         
         total_words = 0
         unique_words = set()
         
-        for chunk in chunks:
-            words = chunk.lower().split()
-            total_words += len(words)
-            unique_words.update(words)
+        for chunk_stats in stats:
+            total_words += len(chunk_stats.lower_words)
+            unique_words.update(chunk_stats.lower_set)
         
         if total_words == 0:
             return 0.0
@@ -122,28 +226,36 @@ class ChunkQualityAnalyzer:
         total_indicators = 0
         
         for chunk in chunks:
-            # Check for structural elements
-            has_headers = bool(re.search(r'^#{1,6}\s+', chunk, re.MULTILINE))
-            has_lists = bool(re.search(r'^[\*\-]\s+', chunk, re.MULTILINE))
-            has_numbers = bool(re.search(r'^\d+\.\s+', chunk, re.MULTILINE))
-            has_paragraphs = chunk.count('\n\n') > 0
+            # Check for structural elements: headers, lists and numbered items
+            # in one scan, stopping once all three have been seen
+            found = [False, False, False]
+            for match in _STRUCT_RE.finditer('\n' + chunk):
+                found[match.lastindex - 1] = True
+                if all(found):
+                    break
+            has_paragraphs = '\n\n' in chunk
             
             total_indicators += 4
-            structural_indicators += sum([has_headers, has_lists, has_numbers, has_paragraphs])
+            structural_indicators += sum(found) + has_paragraphs
         
         return structural_indicators / total_indicators if total_indicators > 0 else 0.0
     
     def analyze_language_quality(self, chunks: List[str]) -> float:
         """Analyze language quality metrics"""
+        return self._language_quality_from_stats([_chunk_stats(chunk) for chunk in chunks])
+    
+    def _language_quality_from_stats(self, stats: List[ChunkStats]) -> float:
         quality_scores = []
         
-        for chunk in chunks:
+        for chunk_stats in stats:
+            chunk = chunk_stats.text
+            n_words = len(chunk_stats.words)
+            
             # Check for proper capitalization
-            sentences = re.split(r'[.!?]+', chunk)
             proper_caps = 0
             total_sentences = 0
             
-            for sentence in sentences:
+            for sentence in chunk_stats.sentences:
                 sentence = sentence.strip()
                 if len(sentence) > 0:
                     total_sentences += 1
@@ -153,11 +265,10 @@ class ChunkQualityAnalyzer:
             cap_score = proper_caps / total_sentences if total_sentences > 0 else 1.0
             
             # Check for punctuation
-            punct_score = min(1.0, chunk.count('.') + chunk.count('!') + chunk.count('?') / len(chunk.split()))
+            punct_score = min(1.0, chunk.count('.') + chunk.count('!') + chunk.count('?') / n_words)
             
             # Check for spelling (basic check for common words)
-            common_words = ['the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by']
-            word_score = sum(1 for word in chunk.lower().split() if word in common_words) / len(chunk.split()) if chunk.split() else 0
+            word_score = sum(1 for word in chunk_stats.lower_words if word in _COMMON_WORDS) / n_words if n_words else 0
             
             quality_scores.append((cap_score + punct_score + word_score) / 3)
         
@@ -168,51 +279,46 @@ class ChunkQualityAnalyzer:
         if not unstructured_chunks or not docling_chunks:
             return 0.0
         
-        # Combine all chunks for each method
-        unstructured_text = ' '.join(unstructured_chunks).lower()
-        docling_text = ' '.join(docling_chunks).lower()
-        
-        # Extract unique words
-        unstructured_words = set(unstructured_text.split())
-        docling_words = set(docling_text.split())
+        # Unique words per method, merged from the memoized per-chunk sets
+        # (analyze_chunk_quality has usually tokenized these chunks already)
+        # instead of joining, lowercasing and splitting each whole corpus again
+        unstructured_words = set().union(*(_chunk_stats(chunk).lower_set for chunk in unstructured_chunks))
+        docling_words = set().union(*(_chunk_stats(chunk).lower_set for chunk in docling_chunks))
         
         if len(unstructured_words) == 0 or len(docling_words) == 0:
             return 0.0
         
         # Calculate Jaccard similarity
         intersection = len(unstructured_words.intersection(docling_words))
-        union = len(unstructured_words.union(docling_words))
+        union = len(unstructured_words) + len(docling_words) - intersection
         
         return intersection / union if union > 0 else 0.0
     
     def analyze_semantic_continuity(self, chunks: List[str]) -> float:
         """Analyze semantic continuity between chunks"""
-        if len(chunks) < 2:
+        return self._semantic_continuity_from_stats([_chunk_stats(chunk) for chunk in chunks])
+    
+    def _semantic_continuity_from_stats(self, stats: List[ChunkStats]) -> float:
+        if len(stats) < 2:
             return 1.0
         
         continuity_scores = []
         
-        for i in range(len(chunks) - 1):
-            chunk1 = chunks[i]
-            chunk2 = chunks[i + 1]
-            
+        # Key terms (words minus common stop words) per chunk, computed once
+        # rather than twice as each chunk takes both sides of a pair
+        key_terms = [chunk_stats.lower_set - _STOP_WORDS for chunk_stats in stats]
+        
+        for i in range(len(stats) - 1):
             # Check for semantic connectors
-            connectors = ['however', 'therefore', 'furthermore', 'moreover', 'additionally', 
-                        'consequently', 'thus', 'hence', 'meanwhile', 'subsequently']
-            
-            connector_count = sum(1 for connector in connectors if connector in chunk2.lower())
+            next_lower = stats[i + 1].lower
+            connector_count = sum(1 for connector in _CONNECTORS if connector in next_lower)
             
             # Check for topic continuity (shared key terms)
-            words1 = set(chunk1.lower().split())
-            words2 = set(chunk2.lower().split())
-            
-            # Remove common stop words
-            stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-            words1 = words1 - stop_words
-            words2 = words2 - stop_words
+            words1 = key_terms[i]
+            words2 = key_terms[i + 1]
             
             shared_terms = len(words1.intersection(words2))
-            total_terms = len(words1.union(words2))
+            total_terms = len(words1) + len(words2) - shared_terms
             
             term_similarity = shared_terms / total_terms if total_terms > 0 else 0.0
             
@@ -227,24 +333,33 @@ class ChunkQualityAnalyzer:
         if not chunks:
             return ChunkQualityMetrics(0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
         
+        # Tokenize every chunk once; all analyzers below read these
+        stats = [_chunk_stats(chunk) for chunk in chunks]
+        
         # Basic metrics
-        chunk_sizes_words = [len(chunk.split()) for chunk in chunks]
-        chunk_sizes_chars = [len(chunk) for chunk in chunks]
+        chunk_sizes_words = np.fromiter(
+            (len(chunk_stats.words) for chunk_stats in stats), dtype=np.int64, count=len(stats)
+        )
+        chunk_sizes_chars = np.fromiter((len(chunk) for chunk in chunks), dtype=np.int64, count=len(chunks))
         
-        avg_words = statistics.mean(chunk_sizes_words)
-        avg_chars = statistics.mean(chunk_sizes_chars)
-        std_words = statistics.stdev(chunk_sizes_words) if len(chunk_sizes_words) > 1 else 0
+        avg_words = float(chunk_sizes_words.mean())
+        avg_chars = float(chunk_sizes_chars.mean())
+        std_words = float(chunk_sizes_words.std(ddof=1)) if chunk_sizes_words.size > 1 else 0.0
         
         # Quality metrics
-        readability_scores = [self.analyze_readability(chunk) for chunk in chunks]
-        avg_readability = statistics.mean(readability_scores)
+        readability_scores = _flesch_batch(
+            [len(chunk_stats.words) for chunk_stats in stats],
+            [len(chunk_stats.sentences) for chunk_stats in stats],
+            [chunk_stats.syllable_count for chunk_stats in stats],
+        )
+        avg_readability = float(readability_scores.mean())
         
-        coherence = self.analyze_coherence(chunks)
-        completeness = self.analyze_completeness(chunks)
-        info_density = self.analyze_information_density(chunks)
+        coherence = self._coherence_from_stats(stats)
+        completeness = self._completeness_from_stats(stats)
+        info_density = self._information_density_from_stats(stats)
         structural = self.analyze_structural_preservation(chunks)
-        language = self.analyze_language_quality(chunks)
-        continuity = self.analyze_semantic_continuity(chunks)
+        language = self._language_quality_from_stats(stats)
+        continuity = self._semantic_continuity_from_stats(stats)
         
         return ChunkQualityMetrics(
             chunk_count=len(chunks),
@@ -264,20 +379,18 @@ class ChunkQualityAnalyzer:
     def compare_chunk_quality(self, file_path: Path) -> Dict[str, Any]:
         """Compare chunk quality between Unstructured and Docling"""
         print(f"🔍 Analyzing chunk quality for: {file_path.name}")
+        clear_caches()
         
         # Get chunks from both methods
         try:
             # Unstructured chunks
             from unstructured.partition.auto import partition
-            from unstructured.documents.elements import Table
             
             elements = partition(str(file_path), strategy="hi_res")
             
-            # Extract text content and apply smart chunking
-            all_text = ""
-            for element in elements:
-                if hasattr(element, 'text') and element.text and not isinstance(element, Table):
-                    all_text += element.text + "\n\n"
+            # Split non-table text from tables in one type-dispatched pass and
+            # apply smart chunking
+            all_text = self.benchmark.summarize_elements(elements)["text"]
             
             unstructured_chunks = self.benchmark.smart_chunk_text(all_text, max_words_per_chunk=500)
             